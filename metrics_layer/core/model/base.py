@@ -5,6 +5,7 @@ from typing import Iterable
 from metrics_layer.core.exceptions import QueryError
 
 NAME_REGEX = re.compile(r"([A-Za-z0-9\_]+)")
+FIELD_REFERENCE_REGEX = re.compile(r"\$\{(.*?)\}", re.MULTILINE)
 
 
 class MetricsLayerBase:
@@ -90,5 +91,4 @@ class MetricsLayerBase:
 class SQLReplacement:
     @staticmethod
     def fields_to_replace(text: str):
-        matches = re.finditer(r"\$\{(.*?)\}", text, re.MULTILINE)
-        return [match.group(1) for match in matches]
+        return FIELD_REFERENCE_REGEX.findall(text)
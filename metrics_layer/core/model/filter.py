@@ -115,6 +115,60 @@ class FilterInterval(str, Enum):
             return cls.unknown
 
 
+# The relative date patterns only depend on the (fixed) interval names, so compile them once
+_INTERVAL_CONDITION = "|".join(FilterInterval.all())
+_N_INTERVAL_AGO_FOR_REGEX = re.compile(
+    rf"(\d+)\s+({_INTERVAL_CONDITION})\s+ago\s+for\s+(\d+)\s+({_INTERVAL_CONDITION})"
+)
+_N_INTERVAL_MODIFIER_REGEX = re.compile(
+    rf"(\d+\s+|this\s+|last\s+|)({_INTERVAL_CONDITION})\s+(ago\s+to\s+date|ago|to\s+date)"
+)
+_N_INTERVAL_REGEX = re.compile(rf"(\d+|this|last)\s+({_INTERVAL_CONDITION})")
+
+
+# (pattern, negated, case insensitive) for each LIKE filter, string values are formatted into the pattern
+_LIKE_PATTERNS = {
+    MetricsLayerFilterExpressionType.Like: ("{}", False, False),
+    MetricsLayerFilterExpressionType.Contains: ("%{}%", False, False),
+    MetricsLayerFilterExpressionType.DoesNotContain: ("%{}%", True, False),
+    MetricsLayerFilterExpressionType.ContainsCaseInsensitive: ("%{}%", False, True),
+    MetricsLayerFilterExpressionType.DoesNotContainCaseInsensitive: ("%{}%", True, True),
+    MetricsLayerFilterExpressionType.StartsWith: ("{}%", False, False),
+    MetricsLayerFilterExpressionType.EndsWith: ("%{}", False, False),
+    MetricsLayerFilterExpressionType.DoesNotStartWith: ("{}%", True, False),
+    MetricsLayerFilterExpressionType.DoesNotEndWith: ("%{}", True, False),
+    MetricsLayerFilterExpressionType.StartsWithCaseInsensitive: ("{}%", False, True),
+    MetricsLayerFilterExpressionType.EndsWithCaseInsensitive: ("%{}", False, True),
+    MetricsLayerFilterExpressionType.DoesNotStartWithCaseInsensitive: ("{}%", True, True),
+    MetricsLayerFilterExpressionType.DoesNotEndWithCaseInsensitive: ("%{}", True, True),
+}
+
+_CRITERION_STRATEGIES = {
+    MetricsLayerFilterExpressionType.LessThan: lambda f, value: f < value,
+    MetricsLayerFilterExpressionType.LessOrEqualThan: lambda f, value: f <= value,
+    MetricsLayerFilterExpressionType.EqualTo: lambda f, value: f == value,
+    MetricsLayerFilterExpressionType.NotEqualTo: lambda f, value: f != value,
+    MetricsLayerFilterExpressionType.GreaterOrEqualThan: lambda f, value: f >= value,
+    MetricsLayerFilterExpressionType.GreaterThan: lambda f, value: f > value,
+    MetricsLayerFilterExpressionType.IsNull: lambda f, value: f.isnull(),
+    MetricsLayerFilterExpressionType.IsNotNull: lambda f, value: f.notnull(),
+    MetricsLayerFilterExpressionType.IsIn: lambda f, value: f.isin(value),
+    MetricsLayerFilterExpressionType.IsNotIn: lambda f, value: f.isin(value).negate(),
+    MetricsLayerFilterExpressionType.BooleanTrue: lambda f, value: LiteralValueCriterion(f),
+    MetricsLayerFilterExpressionType.BooleanFalse: lambda f, value: f.negate(),
+    MetricsLayerFilterExpressionType.IsTrue: lambda f, value: LiteralValueCriterion(f),
+    MetricsLayerFilterExpressionType.IsFalse: lambda f, value: f.negate(),
+}
+
+
+def _like_criterion(field: LiteralValue, value, pattern: str, negated: bool, case_insensitive: bool):
+    if isinstance(value, str):
+        value = pattern.format(value)
+    if case_insensitive:
+        field, value = Lower(field), Lower(value)
+    return field.not_like(value) if negated else field.like(value)
+
+
 class Filter(MetricsLayerBase):
     week_start_day_default = pendulum.MONDAY
     week_end_day_default = pendulum.SUNDAY
@@ -243,25 +297,21 @@ class Filter(MetricsLayerBase):
 
         # Match regex patterns to the various date filters and when patterns
         # match assume it's a date not a string comparison
-        interval_condition = "|".join(FilterInterval.all())
-        interval_ago_for_result = Filter._parse_n_interval_ago_for(date_condition, interval_condition, tz=tz)
+        interval_ago_for_result = Filter._parse_n_interval_ago_for(date_condition, tz=tz)
         if interval_ago_for_result:
             return interval_ago_for_result
 
-        interval_modifier_result = Filter._parse_n_interval_modifier(
-            date_condition, interval_condition, tz=tz
-        )
+        interval_modifier_result = Filter._parse_n_interval_modifier(date_condition, tz=tz)
         if interval_modifier_result:
             return interval_modifier_result
 
-        n_interval_result = Filter._parse_n_interval(date_condition, interval_condition, tz=tz)
+        n_interval_result = Filter._parse_n_interval(date_condition, tz=tz)
         if n_interval_result:
             return n_interval_result
 
     @staticmethod
-    def _parse_n_interval(date_condition: str, interval_condition: str, tz: str):
-        regex = rf"(\d+|this|last)\s+({interval_condition})"  # noqa
-        result = re.search(regex, str(date_condition))
+    def _parse_n_interval(date_condition: str, tz: str):
+        result = _N_INTERVAL_REGEX.search(str(date_condition))
         if not result:
             return
 
@@ -287,9 +337,8 @@ class Filter(MetricsLayerBase):
         return result
 
     @staticmethod
-    def _parse_n_interval_modifier(date_condition: str, interval_condition: str, tz: str):
-        regex = rf"(\d+\s+|this\s+|last\s+|)({interval_condition})\s+(ago\s+to\s+date|ago|to\s+date)"  # noqa
-        result = re.search(regex, str(date_condition))
+    def _parse_n_interval_modifier(date_condition: str, tz: str):
+        result = _N_INTERVAL_MODIFIER_REGEX.search(str(date_condition))
         if not result:
             return
 
@@ -328,9 +377,8 @@ class Filter(MetricsLayerBase):
         return result
 
     @staticmethod
-    def _parse_n_interval_ago_for(date_condition: str, interval_condition: str, tz: str):
-        regex = rf"(\d+)\s+({interval_condition})\s+ago\s+for\s+(\d+)\s+({interval_condition})"  # noqa
-        result = re.search(regex, str(date_condition))
+    def _parse_n_interval_ago_for(date_condition: str, tz: str):
+        result = _N_INTERVAL_AGO_FOR_REGEX.search(str(date_condition))
         if not result:
             return
 
@@ -541,61 +589,9 @@ class Filter(MetricsLayerBase):
             and field_datatype == "number"
         ):
             value = [pd.to_numeric(v) for v in value]
-        criterion_strategies = {
-            MetricsLayerFilterExpressionType.LessThan: lambda f: f < value,
-            MetricsLayerFilterExpressionType.LessOrEqualThan: lambda f: f <= value,
-            MetricsLayerFilterExpressionType.EqualTo: lambda f: f == value,
-            MetricsLayerFilterExpressionType.NotEqualTo: lambda f: f != value,
-            MetricsLayerFilterExpressionType.GreaterOrEqualThan: lambda f: f >= value,
-            MetricsLayerFilterExpressionType.GreaterThan: lambda f: f > value,
-            MetricsLayerFilterExpressionType.Like: lambda f: f.like(value),
-            MetricsLayerFilterExpressionType.Contains: lambda f: f.like(f"%{value}%")
-            if isinstance(value, str)
-            else f.like(value),
-            MetricsLayerFilterExpressionType.DoesNotContain: lambda f: f.not_like(f"%{value}%")
-            if isinstance(value, str)
-            else f.not_like(value),
-            MetricsLayerFilterExpressionType.ContainsCaseInsensitive: lambda f: Lower(f).like(
-                Lower(f"%{value}%") if isinstance(value, str) else Lower(value)
-            ),
-            MetricsLayerFilterExpressionType.DoesNotContainCaseInsensitive: lambda f: Lower(f).not_like(
-                Lower(f"%{value}%") if isinstance(value, str) else Lower(value)
-            ),
-            MetricsLayerFilterExpressionType.StartsWith: lambda f: f.like(f"{value}%")
-            if isinstance(value, str)
-            else f.like(value),
-            MetricsLayerFilterExpressionType.EndsWith: lambda f: f.like(f"%{value}")
-            if isinstance(value, str)
-            else f.like(value),
-            MetricsLayerFilterExpressionType.DoesNotStartWith: lambda f: f.not_like(f"{value}%")
-            if isinstance(value, str)
-            else f.not_like(value),
-            MetricsLayerFilterExpressionType.DoesNotEndWith: lambda f: f.not_like(f"%{value}")
-            if isinstance(value, str)
-            else f.not_like(value),
-            MetricsLayerFilterExpressionType.StartsWithCaseInsensitive: lambda f: Lower(f).like(
-                Lower(f"{value}%") if isinstance(value, str) else Lower(value)
-            ),
-            MetricsLayerFilterExpressionType.EndsWithCaseInsensitive: lambda f: Lower(f).like(
-                Lower(f"%{value}") if isinstance(value, str) else Lower(value)
-            ),
-            MetricsLayerFilterExpressionType.DoesNotStartWithCaseInsensitive: lambda f: Lower(f).not_like(
-                Lower(f"{value}%") if isinstance(value, str) else Lower(value)
-            ),
-            MetricsLayerFilterExpressionType.DoesNotEndWithCaseInsensitive: lambda f: Lower(f).not_like(
-                Lower(f"%{value}") if isinstance(value, str) else Lower(value)
-            ),
-            MetricsLayerFilterExpressionType.IsNull: lambda f: f.isnull(),
-            MetricsLayerFilterExpressionType.IsNotNull: lambda f: f.notnull(),
-            MetricsLayerFilterExpressionType.IsIn: lambda f: f.isin(value),
-            MetricsLayerFilterExpressionType.IsNotIn: lambda f: f.isin(value).negate(),
-            MetricsLayerFilterExpressionType.BooleanTrue: lambda f: LiteralValueCriterion(f),
-            MetricsLayerFilterExpressionType.BooleanFalse: lambda f: f.negate(),
-            MetricsLayerFilterExpressionType.IsTrue: lambda f: LiteralValueCriterion(f),
-            MetricsLayerFilterExpressionType.IsFalse: lambda f: f.negate(),
-        }
-
+        if expression_type in _LIKE_PATTERNS:
+            return _like_criterion(field, value, *_LIKE_PATTERNS[expression_type])
         try:
-            return criterion_strategies[expression_type](field)
+            return _CRITERION_STRATEGIES[expression_type](field, value)
         except KeyError:
             raise QueryError(f"Unknown filter expression_type: {expression_type}.")
@@ -56,6 +56,8 @@ class Project:
     def refresh_cache(self):
         # Clear LRU Caches
         self.fields.cache_clear()
+        self.metrics.cache_clear()
+        self.dimensions.cache_clear()
         self.get_field.cache_clear()
         self.get_field_by_name.cache_clear()
         self.get_field_by_tag.cache_clear()
@@ -496,6 +498,17 @@ class Project:
         else:
             return self._view_fields(view_name, show_hidden, expand_dimension_groups, model)
 
+    @functools.lru_cache(maxsize=None)
+    def metrics(self, view_name: Union[str, None] = None, show_hidden: bool = True) -> tuple:
+        # A tuple, so callers can't modify the cached result
+        fields = self.fields(view_name=view_name, show_hidden=show_hidden)
+        return tuple(f for f in fields if f.field_type == "measure")
+
+    @functools.lru_cache(maxsize=None)
+    def dimensions(self, view_name: Union[str, None] = None, show_hidden: bool = True) -> tuple:
+        fields = self.fields(view_name=view_name, show_hidden=show_hidden)
+        return tuple(f for f in fields if f.field_type in {"dimension", "dimension_group"})
+
     def _all_fields(self, show_hidden: bool, expand_dimension_groups: bool, model: Model):
         return [f for v in self.views(model=model) for f in v.fields(show_hidden, expand_dimension_groups)]
 
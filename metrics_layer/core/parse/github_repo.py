@@ -2,7 +2,6 @@ import os
 import shutil
 from glob import glob
 import pathlib
-import yaml
 
 import git
 
@@ -49,6 +48,9 @@ class BaseRepo:
 
     @staticmethod
     def read_yaml_file(path: str):
+        # pyyaml is only needed here, so defer the import until a project file is read
+        import yaml
+
         with open(path, "r") as f:
             yaml_dict = yaml.safe_load(f)
         return yaml_dict
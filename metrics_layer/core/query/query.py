@@ -191,11 +191,10 @@ class MetricsLayerConnection:
         return self.project.get_field(field_name, view_name=view_name, **kws)
 
     def list_metrics(self, view_name: str = None, names_only: bool = False, show_hidden: bool = False):
-        all_fields = self.project.fields(view_name=view_name, show_hidden=show_hidden)
-        metrics = [f for f in all_fields if f.field_type == "measure"]
+        metrics = self.project.metrics(view_name=view_name, show_hidden=show_hidden)
         if names_only:
             return [m.name for m in metrics]
-        return metrics
+        return list(metrics)
 
     def get_metric(self, metric_name: str, view_name: str = None):
         metrics = self.list_metrics(view_name=view_name)
@@ -206,11 +205,10 @@ class MetricsLayerConnection:
             raise e(f"Could not find metric {metric_name} in the project config")
 
     def list_dimensions(self, view_name: str = None, names_only: bool = False, show_hidden: bool = False):
-        all_fields = self.project.fields(view_name=view_name, show_hidden=show_hidden)
-        dimensions = [f for f in all_fields if f.field_type in {"dimension", "dimension_group"}]
+        dimensions = self.project.dimensions(view_name=view_name, show_hidden=show_hidden)
         if names_only:
             return [d.name for d in dimensions]
-        return dimensions
+        return list(dimensions)
 
     def get_dimension(self, dimension_name: str, view_name: str = None):
         dimensions = self.list_dimensions(view_name=view_name)
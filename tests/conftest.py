@@ -441,25 +441,25 @@ def fresh_dashboards():
     return dashboards
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def models():
     models = [ProjectReaderBase.read_yaml_file(p) for p in model_paths]
     return models
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def views():
     views = [ProjectReaderBase.read_yaml_file(path) for path in view_paths]
     return views
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def dashboards():
     dashboards = [ProjectReaderBase.read_yaml_file(path) for path in dashboard_paths]
     return dashboards
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def manifest():
     mock_manifest = {
         "nodes": {
@@ -486,7 +486,7 @@ def fresh_project(fresh_models, fresh_views, fresh_dashboards, manifest):
     return project
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def project(models, views, dashboards, manifest):
     project = Project(
         models=models,
@@ -499,8 +499,9 @@ def project(models, views, dashboards, manifest):
     return project
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def connections():
+    # Shared by every test in the session, so tests that need to change a connection build their own
     class bq_mock(BaseConnection):
         name = "testing_bigquery"
         type = "BIGQUERY"
@@ -545,6 +546,6 @@ def connections():
     return [sf, bq, db]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def connection(project, connections):
     return MetricsLayerConnection(project=project, connections=connections, verbose=True)
@@ -3,6 +3,15 @@ import pytest
 from metrics_layer.core.exceptions import AccessDeniedOrDoesNotExistException
 
 
+@pytest.fixture(autouse=True)
+def reset_connection_user(connection):
+    yield
+    # The connection is shared across the session, so don't leak the user set here into other tests.
+    # The join graph is cached on the project regardless of user, so it has to be rebuilt as well
+    connection.project.set_user(None)
+    connection.project.refresh_cache()
+
+
 def test_access_grants_join_permission_block(connection):
     connection.project.set_user({"department": "executive"})
     connection.get_sql_query(sql="SELECT * FROM MQL(total_item_revenue BY gender)")
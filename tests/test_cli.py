@@ -1,5 +1,4 @@
 import os
-from copy import copy
 
 import pandas as pd
 import pytest
@@ -398,8 +397,8 @@ def test_cli_seed_metrics_layer(
         else:
             raise AssertionError("undefined model type for seeding")
 
-    old_type = copy(connection._raw_connections[0].type)
-    connection._raw_connections[0].type = query_type
+    # The connection is shared across the session, so let monkeypatch put the type back even if the test fails
+    monkeypatch.setattr(connection._raw_connections[0], "type", query_type)
 
     def mock_init_profile(profile, target):
         assert target == target
@@ -457,7 +456,6 @@ def test_cli_seed_metrics_layer(
         ],
     )
 
-    connection._raw_connections[0].type = old_type
     assert result.exit_code == 0
     assert yaml_dump_called == 7
 
@@ -1033,7 +1031,7 @@ def test_cli_debug(connection, mocker):
         assert not run_pre_queries
         return True
 
-    connection.run_query = query_runner_mock
+    mocker.patch.object(connection, "run_query", query_runner_mock)
     mocker.patch(
         "metrics_layer.cli.seeding.SeedMetricsLayer._init_profile", lambda profile, target: connection
     )
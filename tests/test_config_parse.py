@@ -7,6 +7,27 @@ from metrics_layer.core.query.query import MetricsLayerConnection
 from metrics_layer.core.parse import MetricsLayerProjectReader, ProjectLoader, MetricflowProjectReader
 
 BASE_PATH = os.path.dirname(__file__)
+METRICS_LAYER_PATH = f"{BASE_PATH}/config/metrics_layer/"
+DBT_PATH = f"{BASE_PATH}/config/dbt/"
+METRICFLOW_PATH = f"{BASE_PATH}/config/metricflow/"
+DBT_MANIFEST_PATH = f"{DBT_PATH}target/manifest.json"
+DATA_MODEL_PATH = f"{BASE_PATH}/config/metrics_layer_config/data_model"
+
+_SEARCH_RESULTS = {
+    "*.yml": [f"{DATA_MODEL_PATH}/model_with_all_fields.yml", f"{DATA_MODEL_PATH}/view_with_all_fields.yml"],
+    "manifest.json": [DBT_MANIFEST_PATH],
+}
+
+# Expected python types of the keys in each parsed object, checked in one pass by _assert_shape
+_MODEL_SHAPE = {"name": str, "connection": str}
+_VIEW_SHAPE = {"name": str, "sets": list, "sql_table_name": str, "fields": list}
+_METRICFLOW_VIEW_SHAPE = {"name": str, "identifiers": list, "fields": list}
+_FIELD_SHAPE = {"name": str, "field_type": str, "type": str, "sql": str}
+
+
+def _assert_shape(obj: dict, shape: dict):
+    wrong = {k: type(obj.get(k)).__name__ for k, t in shape.items() if not isinstance(obj.get(k), t)}
+    assert not wrong, f"Unexpected types for keys: {wrong}"
 
 
 class repo_mock(BaseRepo):
@@ -17,8 +38,8 @@ class repo_mock(BaseRepo):
     @property
     def folder(self):
         if self.repo_type == "dbt":
-            return os.path.join(BASE_PATH, "config/dbt/")
-        return os.path.join(BASE_PATH, "config/metrics_layer/")
+            return DBT_PATH
+        return METRICS_LAYER_PATH
 
     @property
     def warehouse_type(self):
@@ -30,15 +51,7 @@ class repo_mock(BaseRepo):
         return
 
     def search(self, pattern, folders):
-        if pattern == "*.yml":
-            view = os.path.join(BASE_PATH, "config/metrics_layer_config/data_model/view_with_all_fields.yml")
-            model = os.path.join(
-                BASE_PATH, "config/metrics_layer_config/data_model/model_with_all_fields.yml"
-            )  # noqa
-            return [model, view]
-        elif pattern == "manifest.json":
-            return [os.path.join(BASE_PATH, "config/dbt/target/manifest.json")]
-        return []
+        return _SEARCH_RESULTS.get(pattern, [])
 
     def delete(self):
         return
@@ -46,12 +59,12 @@ class repo_mock(BaseRepo):
 
 def mock_dbt_search(pattern):
     if pattern == "manifest.json":
-        return [os.path.join(BASE_PATH, "config/dbt/target/manifest.json")]
+        return [DBT_MANIFEST_PATH]
     return []
 
 
 def test_get_branch_options():
-    loader = MetricsLayerConnection(location=os.path.join(BASE_PATH, "config/metrics_layer/"))
+    loader = MetricsLayerConnection(location=METRICS_LAYER_PATH)
     loader.load()
     assert loader.get_branch_options() == []
 
@@ -63,25 +76,16 @@ def test_config_load_yaml():
     model = models[0]
 
     assert model["type"] == "model"
-    assert isinstance(model["name"], str)
-    assert isinstance(model["connection"], str)
+    _assert_shape(model, _MODEL_SHAPE)
 
     view = views[0]
 
     assert view["type"] == "view"
-    assert isinstance(view["name"], str)
-    assert isinstance(view["sets"], list)
+    _assert_shape(view, _VIEW_SHAPE)
     assert isinstance(view["sets"][0], dict)
     assert view["sets"][0]["name"] == "set_name"
-    assert isinstance(view["sql_table_name"], str)
-    assert isinstance(view["fields"], list)
-
-    field = view["fields"][0]
 
-    assert isinstance(field["name"], str)
-    assert isinstance(field["field_type"], str)
-    assert isinstance(field["type"], str)
-    assert isinstance(field["sql"], str)
+    _assert_shape(view["fields"][0], _FIELD_SHAPE)
 
     assert len(dashboards) == 0
 
@@ -103,7 +107,7 @@ def test_bad_repo_type(monkeypatch):
 @pytest.mark.dbt
 def test_config_load_dbt(monkeypatch):
     mock = repo_mock(repo_type="dbt")
-    mock.dbt_path = os.path.join(BASE_PATH, "config/dbt/")
+    mock.dbt_path = DBT_PATH
     monkeypatch.setattr(ProjectLoader, "_get_repo", lambda *args: mock)
 
     reader = ProjectLoader(location=None)
@@ -116,7 +120,7 @@ def test_config_load_dbt(monkeypatch):
 @pytest.mark.dbt
 def test_config_load_metricflow():
     mock = repo_mock(repo_type="metricflow")
-    mock.dbt_path = os.path.join(BASE_PATH, "config/metricflow/")
+    mock.dbt_path = METRICFLOW_PATH
     reader = MetricflowProjectReader(repo=mock)
     models, views, dashboards = reader.load()
 
@@ -129,16 +133,15 @@ def test_config_load_metricflow():
     view = next(v for v in views if v["name"] == "order_item")
 
     assert view["type"] == "view"
-    assert isinstance(view["name"], str)
-    assert isinstance(view["identifiers"], list)
+    _assert_shape(view, _METRICFLOW_VIEW_SHAPE)
     # assert view["sql_table_name"] == "order_item"
     assert view["default_date"] == "ordered_at"
-    assert isinstance(view["fields"], list)
 
-    ordered_at = next((f for f in view["fields"] if f["name"] == "ordered_at"))
-    food_bool = next((f for f in view["fields"] if f["name"] == "is_food_item"))
-    revenue_measure = next((f for f in view["fields"] if f["name"] == "_revenue"))
-    median_revenue_metric = next((f for f in view["fields"] if f["name"] == "median_revenue"))
+    fields_by_name = {f["name"]: f for f in view["fields"]}
+    ordered_at = fields_by_name["ordered_at"]
+    food_bool = fields_by_name["is_food_item"]
+    revenue_measure = fields_by_name["_revenue"]
+    median_revenue_metric = fields_by_name["median_revenue"]
 
     assert ordered_at["type"] == "time"
     assert ordered_at["field_type"] == "dimension_group"
@@ -364,12 +364,14 @@ def test_query_single_join_with_tier(connection):
         dimensions=["order_tier", "new_vs_repeat"],
     )
 
-    tier_case_query = "case when order_lines.revenue < 0 then 'Below 0' when order_lines.revenue >= 0 "
-    tier_case_query += "and order_lines.revenue < 20 then '[0,20)' when order_lines.revenue >= 20 and "
-    tier_case_query += "order_lines.revenue < 50 then '[20,50)' when order_lines.revenue >= 50 and "
-    tier_case_query += "order_lines.revenue < 100 then '[50,100)' when order_lines.revenue >= 100 and "
-    tier_case_query += "order_lines.revenue < 300 then '[100,300)' when order_lines.revenue >= 300 "
-    tier_case_query += "then '[300,inf)' else 'Unknown' end"
+    tier_case_query = (
+        "case when order_lines.revenue < 0 then 'Below 0' when order_lines.revenue >= 0 "
+        "and order_lines.revenue < 20 then '[0,20)' when order_lines.revenue >= 20 and "
+        "order_lines.revenue < 50 then '[20,50)' when order_lines.revenue >= 50 and "
+        "order_lines.revenue < 100 then '[50,100)' when order_lines.revenue >= 100 and "
+        "order_lines.revenue < 300 then '[100,300)' when order_lines.revenue >= 300 "
+        "then '[300,inf)' else 'Unknown' end"
+    )
 
     correct = (
         f"SELECT {tier_case_query} as order_lines_order_tier,orders.new_vs_repeat as orders_new_vs_repeat,"
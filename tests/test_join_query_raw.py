@@ -100,24 +100,19 @@ def test_query_single_join_raw_select_args(connection):
 
 
 @pytest.mark.query
-def test_query_single_join_having_error(connection):
+@pytest.mark.parametrize(
+    "query_args",
+    [
+        {"having": [{"field": "total_item_revenue", "expression": "less_than", "value": 22}]},
+        {"order_by": [{"field": "total_item_revenue"}]},
+    ],
+)
+def test_query_single_join_raw_aggregate_args_error(connection, query_args):
     with pytest.raises(ArgumentError) as exc_info:
         connection.get_sql_query(
             metrics=["total_item_revenue"],
             dimensions=["order_lines.order_line_id", "channel", "new_vs_repeat"],
-            having=[{"field": "total_item_revenue", "expression": "less_than", "value": 22}],
-        )
-
-    assert exc_info.value
-
-
-@pytest.mark.query
-def test_query_single_join_order_by_error(connection):
-    with pytest.raises(ArgumentError) as exc_info:
-        connection.get_sql_query(
-            metrics=["total_item_revenue"],
-            dimensions=["order_lines.order_line_id", "channel", "new_vs_repeat"],
-            order_by=[{"field": "total_item_revenue"}],
+            **query_args,
         )
 
     assert exc_info.value
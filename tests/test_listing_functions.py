@@ -1,14 +1,7 @@
 import pytest
 
-
-@pytest.mark.project
-def test_list_metrics(connection):
-    metrics = connection.list_metrics()
-    assert len(metrics) == 61
-
-    metrics = connection.list_metrics(view_name="order_lines", names_only=True)
-    assert len(metrics) == 11
-    assert set(metrics) == {
+_ORDER_LINES_METRICS = frozenset(
+    {
         "average_order_revenue",
         "costs_per_session",
         "ending_on_hand_qty",
@@ -21,18 +14,9 @@ def test_list_metrics(connection):
         "total_item_costs_pct",
         "total_item_revenue",
     }
-
-
-@pytest.mark.project
-def test_list_dimensions(connection):
-    dimensions = connection.list_dimensions(show_hidden=True)
-    assert len(dimensions) == 100
-
-    dimensions = connection.list_dimensions()
-    assert len(dimensions) == 66
-
-    dimensions = connection.list_dimensions(view_name="order_lines", names_only=True, show_hidden=True)
-    dimensions_present = {
+)
+_ORDER_LINES_DIMENSIONS = frozenset(
+    {
         "order_line_id",
         "order_id",
         "customer_id",
@@ -46,8 +30,37 @@ def test_list_dimensions(connection):
         "is_on_sale_case",
         "order_tier",
     }
+)
+
+
+@pytest.mark.project
+def test_list_metrics(connection):
+    metrics = connection.list_metrics()
+    assert len(metrics) == 61
+
+    # Changing the returned list must not change what the next caller sees
+    metrics.pop()
+    assert len(connection.list_metrics()) == 61
+
+    metrics = connection.list_metrics(view_name="order_lines", names_only=True)
+    assert len(metrics) == 11
+    assert frozenset(metrics) == _ORDER_LINES_METRICS
+
+
+@pytest.mark.project
+def test_list_dimensions(connection):
+    dimensions = connection.list_dimensions(show_hidden=True)
+    assert len(dimensions) == 100
+
+    dimensions.pop()
+    assert len(connection.list_dimensions(show_hidden=True)) == 100
+
+    dimensions = connection.list_dimensions()
+    assert len(dimensions) == 66
+
+    dimensions = connection.list_dimensions(view_name="order_lines", names_only=True, show_hidden=True)
     assert len(dimensions) == 12
-    assert set(dimensions) == dimensions_present
+    assert frozenset(dimensions) == _ORDER_LINES_DIMENSIONS
 
 
 @pytest.mark.project
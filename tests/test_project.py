@@ -125,4 +125,4 @@ def test_add_field_personal_fields_are_warnings(connection):
     assert errors != []
     assert all("Warning:" in e["message"] for e in errors)
 
-    connection.project.remove_field("total_new_revenue", view_name="orders")
+    connection.project.remove_field("total_new_revenue!", view_name="orders")
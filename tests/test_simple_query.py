@@ -1,5 +1,6 @@
 from copy import deepcopy
 from datetime import datetime
+from string import Template
 
 import pendulum
 import pytest
@@ -13,6 +14,40 @@ from metrics_layer.core.model import Definitions, Project
 from metrics_layer.core.parse.connections import BaseConnection
 from metrics_layer.core.sql.query_errors import ParseError
 
+# Keep this module on one xdist worker so the module-scoped simple_conn is only built once
+pytestmark = pytest.mark.xdist_group("simple_query")
+
+# Dialect groupings used by the expected SQL, built once rather than as a set literal on every check
+_SF_OR_RS = frozenset({Definitions.snowflake, Definitions.redshift})
+_DEFAULT_NULLS_LAST = frozenset({Definitions.snowflake, Definitions.redshift, Definitions.duck_db})
+_SQL_SERVER_DIALECTS = frozenset({Definitions.sql_server, Definitions.azure_synapse})
+_PG_TRINO_DUCK = frozenset({Definitions.postgres, Definitions.trino, Definitions.duck_db})
+_DUCK_OR_TRINO = frozenset({Definitions.duck_db, Definitions.trino})
+_NO_SEMICOLON = frozenset(Definitions.no_semicolon_warehouses)
+_CAST_TO_TIMESTAMP = frozenset(
+    {Definitions.druid, Definitions.duck_db, Definitions.databricks, Definitions.trino}
+)
+_NO_DEFAULT_ORDER = frozenset(
+    {
+        Definitions.bigquery,
+        Definitions.databricks,
+        Definitions.druid,
+        Definitions.sql_server,
+        Definitions.trino,
+    }
+)
+_ORDER_BY_NULLS_LAST = frozenset(
+    {
+        Definitions.snowflake,
+        Definitions.redshift,
+        Definitions.duck_db,
+        Definitions.postgres,
+        Definitions.trino,
+        Definitions.databricks,
+        Definitions.bigquery,
+    }
+)
+
 simple_model = {
     "type": "model",
     "name": "core",
@@ -159,13 +194,40 @@ simple_view = {
 }
 
 
+# Shared pieces of the expected SQL for the revenue by channel queries
+_CHANNEL_COL = "simple.sales_channel"
+_REVENUE_SUM = "SUM(simple.revenue)"
+_REVENUE_ALIAS = "simple_total_revenue"
+_SELECT_PREFIX = (
+    f"SELECT {_CHANNEL_COL} as simple_channel,{_REVENUE_SUM} as {_REVENUE_ALIAS} "
+    "FROM analytics.orders simple "
+)
+_GROUP_BY = f"GROUP BY {_CHANNEL_COL}"
+_ORDER_DESC = f" ORDER BY {_REVENUE_ALIAS} DESC NULLS LAST"
+_CHANNEL_TEMPLATE = Template(_SELECT_PREFIX + "${where}" + _GROUP_BY + "${having}${order_by}${semi}")
+
+
+@pytest.fixture(scope="module")
+def simple_conn(connections):
+    # Deep copies, so nothing a test does to this project can reach the shared definitions
+    project = Project(models=[deepcopy(simple_model)], views=[deepcopy(simple_view)])
+    return MetricsLayerConnection(project=project, connections=connections)
+
+
+@pytest.fixture
+def simple_conn_ny(simple_conn):
+    # simple_conn is shared across the module, so put back whatever timezone it had before
+    previous_timezone = simple_conn.project._timezone
+    simple_conn.project.set_timezone("America/New_York")
+    yield simple_conn
+    simple_conn.project.set_timezone(previous_timezone)
+
+
 @pytest.mark.query
 def test_simple_query_dynamic_schema():
-    view = deepcopy(simple_view)
-    view["sql_table_name"] = "{{ref('orders')}}"
-
-    simple_model["connection"] = "testing_simple_snowflake"
-    project = Project(models=[simple_model], views=[view])
+    view = {**deepcopy(simple_view), "sql_table_name": "{{ref('orders')}}"}
+    model = {**deepcopy(simple_model), "connection": "testing_simple_snowflake"}
+    project = Project(models=[model], views=[view])
 
     correct = (
         "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
@@ -193,29 +255,18 @@ def test_simple_query_dynamic_schema():
     table_name = "prod.orders"
     assert query == correct.format(table_name)
 
-    simple_model["connection"] = "testing_snowflake"
-
 
 @pytest.mark.query
-def test_simple_query(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["total_revenue"], dimensions=["channel"])
+def test_simple_query(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["total_revenue"], dimensions=["channel"])
 
-    correct = (
-        "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
-    )
-    correct += (
-        "analytics.orders simple GROUP BY simple.sales_channel ORDER BY simple_total_revenue DESC NULLS LAST;"
-    )
+    correct = f"{_SELECT_PREFIX}{_GROUP_BY}{_ORDER_DESC};"
     assert query == correct
 
 
 @pytest.mark.query
-def test_simple_query_dimension_filter(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["total_revenue"], dimensions=["organic_channels"])
+def test_simple_query_dimension_filter(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["total_revenue"], dimensions=["organic_channels"])
 
     correct = (
         "SELECT case when LOWER(simple.sales_channel) LIKE LOWER('%organic%') then simple.sales_channel end"
@@ -227,10 +278,8 @@ def test_simple_query_dimension_filter(connections):
 
 
 @pytest.mark.query
-def test_simple_query_field_on_field_filter(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_field_on_field_filter(simple_conn):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"],
         dimensions=["organic_channels"],
         where=[{"field": "new_vs_repeat", "expression": "greater_than", "value": "simple.group"}],
@@ -271,20 +320,18 @@ def test_simple_query_field_on_field_filter(connections):
         ("min_revenue", Definitions.duck_db),
     ],
 )
-def test_simple_query_min_max(connections, metric, query_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=[metric], dimensions=["channel"], query_type=query_type)
+def test_simple_query_min_max(simple_conn, metric, query_type):
+    query = simple_conn.get_sql_query(metrics=[metric], dimensions=["channel"], query_type=query_type)
 
     agg = "MIN" if "min" in metric else "MAX"
     group_by = "simple.sales_channel"
     semi = ";"
-    if query_type in {Definitions.snowflake, Definitions.redshift, Definitions.duck_db}:
+    if query_type in _DEFAULT_NULLS_LAST:
         order_by = f" ORDER BY simple_{agg.lower()}_revenue DESC NULLS LAST"
     else:
         order_by = ""
 
-    if query_type in Definitions.no_semicolon_warehouses:
+    if query_type in _NO_SEMICOLON:
         semi = ""
 
     if query_type == Definitions.bigquery:
@@ -312,19 +359,19 @@ def test_simple_query_min_max(connections, metric, query_type):
         (Definitions.duck_db),
     ],
 )
-def test_simple_query_count_distinct(connections, query_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["unique_groups"], dimensions=["channel"], query_type=query_type)
+def test_simple_query_count_distinct(simple_conn, query_type):
+    query = simple_conn.get_sql_query(
+        metrics=["unique_groups"], dimensions=["channel"], query_type=query_type
+    )
 
     group_by = "simple.sales_channel"
     semi = ";"
-    if query_type in {Definitions.snowflake, Definitions.redshift, Definitions.duck_db}:
+    if query_type in _DEFAULT_NULLS_LAST:
         order_by = f" ORDER BY simple_unique_groups DESC NULLS LAST"
     else:
         order_by = ""
 
-    if query_type in Definitions.no_semicolon_warehouses:
+    if query_type in _NO_SEMICOLON:
         semi = ""
 
     if query_type == Definitions.bigquery:
@@ -338,10 +385,8 @@ def test_simple_query_count_distinct(connections, query_type):
 
 
 @pytest.mark.query
-def test_simple_query_single_metric(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["total_revenue"])
+def test_simple_query_single_metric(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["total_revenue"])
 
     correct = (
         "SELECT SUM(simple.revenue) as simple_total_revenue "
@@ -351,10 +396,8 @@ def test_simple_query_single_metric(connections):
 
 
 @pytest.mark.query
-def test_simple_query_single_dimension(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(dimensions=["channel"])
+def test_simple_query_single_dimension(simple_conn):
+    query = simple_conn.get_sql_query(dimensions=["channel"])
 
     correct = (
         "SELECT simple.sales_channel as simple_channel FROM analytics.orders simple "
@@ -367,17 +410,15 @@ def test_simple_query_single_dimension(connections):
 @pytest.mark.parametrize(
     "query_type", [Definitions.snowflake, Definitions.sql_server, Definitions.azure_synapse]
 )
-def test_simple_query_limit(connections, query_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(dimensions=["channel"], limit=10, query_type=query_type)
+def test_simple_query_limit(simple_conn, query_type):
+    query = simple_conn.get_sql_query(dimensions=["channel"], limit=10, query_type=query_type)
 
     if Definitions.snowflake == query_type:
         correct = (
             "SELECT simple.sales_channel as simple_channel FROM analytics.orders simple "
             "GROUP BY simple.sales_channel ORDER BY simple_channel ASC NULLS LAST LIMIT 10;"
         )
-    elif query_type in {Definitions.sql_server, Definitions.azure_synapse}:
+    elif query_type in _SQL_SERVER_DIALECTS:
         correct = (
             "SELECT TOP (10) simple.sales_channel as simple_channel FROM analytics.orders simple "
             "GROUP BY simple.sales_channel;"
@@ -388,24 +429,24 @@ def test_simple_query_limit(connections, query_type):
 
 
 @pytest.mark.query
-def test_simple_query_count(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["count"], dimensions=["channel"])
+def test_simple_query_count(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["count"], dimensions=["channel"])
 
-    correct = "SELECT simple.sales_channel as simple_channel,COUNT(*) as simple_count FROM "
-    correct += "analytics.orders simple GROUP BY simple.sales_channel ORDER BY simple_count DESC NULLS LAST;"
+    correct = (
+        "SELECT simple.sales_channel as simple_channel,COUNT(*) as simple_count FROM "
+        "analytics.orders simple GROUP BY simple.sales_channel ORDER BY simple_count DESC NULLS LAST;"
+    )
     assert query == correct
 
 
 @pytest.mark.query
-def test_simple_query_alias_keyword(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["count"], dimensions=["group"])
+def test_simple_query_alias_keyword(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["count"], dimensions=["group"])
 
-    correct = "SELECT simple.group_name as simple_group,COUNT(*) as simple_count FROM "
-    correct += "analytics.orders simple GROUP BY simple.group_name ORDER BY simple_count DESC NULLS LAST;"
+    correct = (
+        "SELECT simple.group_name as simple_group,COUNT(*) as simple_count FROM "
+        "analytics.orders simple GROUP BY simple.group_name ORDER BY simple_count DESC NULLS LAST;"
+    )
     assert query == correct
 
 
@@ -442,30 +483,28 @@ def test_simple_query_alias_keyword(connections):
     ],
 )
 @pytest.mark.query
-def test_simple_query_dimension_group_timezone(connections, field: str, group: str, query_type: str):
-    project = Project(models=[simple_model], views=[simple_view])
-    project.set_timezone("America/New_York")
-    conn = MetricsLayerConnection(project=project, connections=connections)
+def test_simple_query_dimension_group_timezone(simple_conn_ny, field: str, group: str, query_type: str):
     if query_type == Definitions.bigquery:
         where_field = "order_raw"
     else:
         where_field = "order_date"
-    query = conn.get_sql_query(
+    query = simple_conn_ny.get_sql_query(
         metrics=["total_revenue"],
         dimensions=[f"{field}_{group}"],
         where=[{"field": where_field, "expression": "matches", "value": "month to date"}],
         query_type=query_type,
     )
 
-    semi = ";" if query_type not in Definitions.no_semicolon_warehouses else ""
+    semi = ";" if query_type not in _NO_SEMICOLON else ""
     date_format = "%Y-%m-%dT%H:%M:%S"
-    start = pendulum.now("America/New_York").start_of("month").strftime(date_format)
-    if pendulum.now("America/New_York").day == 1:
-        end = pendulum.now("America/New_York").end_of("day").strftime(date_format)
+    now = pendulum.now("America/New_York")
+    start = now.start_of("month").strftime(date_format)
+    if now.day == 1:
+        end = now.end_of("day").strftime(date_format)
     else:
-        end = pendulum.now("America/New_York").end_of("day").subtract(days=1).strftime(date_format)
+        end = now.end_of("day").subtract(days=1).strftime(date_format)
 
-    if query_type in {Definitions.snowflake, Definitions.redshift}:
+    if query_type in _SF_OR_RS:
         ttype = "TIMESTAMP" if query_type == Definitions.redshift else "TIMESTAMP_NTZ"
         if field == "previous_order":
             result_lookup = {"date": "DATE_TRUNC('DAY', simple.previous_order_date)"}
@@ -485,7 +524,7 @@ def test_simple_query_dimension_group_timezone(connections, field: str, group: s
             f"AS {ttype}) AS TIMESTAMP))>='{start}' AND DATE_TRUNC('DAY', "
             f"CAST(CAST(CONVERT_TIMEZONE('America/New_York', simple.order_date) AS {ttype}) AS TIMESTAMP))<='{end}'"  # noqa
         )
-        order_by = " ORDER BY simple_total_revenue DESC NULLS LAST"
+        order_by = _ORDER_DESC
     elif query_type == Definitions.databricks:
         if field == "previous_order":
             result_lookup = {"date": "DATE_TRUNC('DAY', CAST(simple.previous_order_date AS TIMESTAMP))"}
@@ -507,9 +546,9 @@ def test_simple_query_dimension_group_timezone(connections, field: str, group: s
             f"CAST(CAST(CAST(CONVERT_TIMEZONE('America/New_York', simple.order_date) AS TIMESTAMP_NTZ) AS TIMESTAMP) AS TIMESTAMP))<='{end}'"  # noqa
         )
         order_by = ""
-    elif query_type in {Definitions.postgres, Definitions.trino, Definitions.duck_db}:
+    elif query_type in _PG_TRINO_DUCK:
         if field == "previous_order":
-            if query_type in {Definitions.duck_db, Definitions.trino}:
+            if query_type in _DUCK_OR_TRINO:
                 result_lookup = {"date": "DATE_TRUNC('DAY', CAST(simple.previous_order_date AS TIMESTAMP))"}
             else:
                 result_lookup = {"date": "DATE_TRUNC('DAY', simple.previous_order_date)"}
@@ -539,7 +578,7 @@ def test_simple_query_dimension_group_timezone(connections, field: str, group: s
                 f"CAST(CAST(CAST(simple.order_date AS TIMESTAMP) at time zone 'UTC' at time zone 'America/New_York' AS TIMESTAMP) AS TIMESTAMP))<='{end}'"  # noqa
             )
         if query_type == Definitions.duck_db:
-            order_by = " ORDER BY simple_total_revenue DESC NULLS LAST"
+            order_by = _ORDER_DESC
         else:
             order_by = ""
     elif query_type == Definitions.bigquery:
@@ -577,7 +616,7 @@ def test_simple_query_dimension_group_timezone(connections, field: str, group: s
         order_by = ""
         semi = ""
 
-    elif query_type in {Definitions.sql_server, Definitions.azure_synapse}:
+    elif query_type in _SQL_SERVER_DIALECTS:
         if field == "previous_order":
             result_lookup = {"date": "CAST(CAST(simple.previous_order_date AS DATE) AS DATETIME)"}
         else:
@@ -605,530 +644,617 @@ def test_simple_query_dimension_group_timezone(connections, field: str, group: s
     assert query == correct
 
 
+_DIM_GROUP_SF = {
+    "time": "CAST(simple.order_date AS TIMESTAMP)",
+    "second": "DATE_TRUNC('SECOND', simple.order_date)",
+    "minute": "DATE_TRUNC('MINUTE', simple.order_date)",
+    "hour": "DATE_TRUNC('HOUR', simple.order_date)",
+    "date": "DATE_TRUNC('DAY', simple.order_date)",
+    "week": "DATE_TRUNC('WEEK', CAST(simple.order_date AS DATE) + 1) - 1",
+    "month": "DATE_TRUNC('MONTH', simple.order_date)",
+    "quarter": "DATE_TRUNC('QUARTER', simple.order_date)",
+    "year": "DATE_TRUNC('YEAR', simple.order_date)",
+    "fiscal_month": "DATE_TRUNC('MONTH', DATEADD(MONTH, 1, simple.order_date))",
+    "fiscal_quarter": "DATE_TRUNC('QUARTER', DATEADD(MONTH, 1, simple.order_date))",
+    "fiscal_year": "DATE_TRUNC('YEAR', DATEADD(MONTH, 1, simple.order_date))",
+    "fiscal_month_of_year_index": f"EXTRACT(MONTH FROM DATEADD(MONTH, 1, simple.order_date))",
+    "fiscal_month_index": f"EXTRACT(MONTH FROM DATEADD(MONTH, 1, simple.order_date))",
+    "fiscal_quarter_of_year": "EXTRACT(QUARTER FROM DATEADD(MONTH, 1, simple.order_date))",
+    "week_index": f"EXTRACT(WEEK FROM DATE_TRUNC('DAY', CAST(simple.order_date AS DATE) + 1))",
+    "week_of_year": f"EXTRACT(WEEK FROM DATE_TRUNC('DAY', CAST(simple.order_date AS DATE) + 1))",
+    "week_of_month": (
+        f"EXTRACT(WEEK FROM simple.order_date) -"
+        f" EXTRACT(WEEK FROM DATE_TRUNC('MONTH', simple.order_date)) + 1"
+    ),
+    "month_of_year_index": f"EXTRACT(MONTH FROM simple.order_date)",
+    "month_index": f"EXTRACT(MONTH FROM simple.order_date)",
+    "month_of_year": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')",
+    "month_name": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')",
+    "month_of_year_full_name": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'MMMM')",
+    "quarter_of_year": "EXTRACT(QUARTER FROM simple.order_date)",
+    "hour_of_day": "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_week": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Dy')",
+    "day_of_month": "EXTRACT(DAY FROM simple.order_date)",
+    "day_of_year": "EXTRACT(DOY FROM simple.order_date)",
+}
+
+_DIM_GROUP_SQL_SERVER = {
+    "time": "CAST(simple.order_date AS DATETIME)",
+    "second": "DATEADD(SECOND, DATEDIFF(SECOND, 0, CAST(simple.order_date AS DATETIME)), 0)",
+    "minute": "DATEADD(MINUTE, DATEDIFF(MINUTE, 0, CAST(simple.order_date AS DATETIME)), 0)",
+    "hour": "DATEADD(HOUR, DATEDIFF(HOUR, 0, CAST(simple.order_date AS DATETIME)), 0)",
+    "date": "CAST(CAST(simple.order_date AS DATE) AS DATETIME)",
+    "week": (  # noqa
+        "DATEADD(DAY, -1, DATEADD(WEEK, DATEDIFF(WEEK, 0, DATEADD(DAY, 1, CAST(simple.order_date AS"
+        " DATE))), 0))"
+    ),
+    "month": "DATEADD(MONTH, DATEDIFF(MONTH, 0, CAST(simple.order_date AS DATE)), 0)",
+    "quarter": "DATEADD(QUARTER, DATEDIFF(QUARTER, 0, CAST(simple.order_date AS DATE)), 0)",
+    "year": "DATEADD(YEAR, DATEDIFF(YEAR, 0, CAST(simple.order_date AS DATE)), 0)",
+    "fiscal_month": (
+        "DATEADD(MONTH, DATEDIFF(MONTH, 0, CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE)), 0)"
+    ),
+    "fiscal_quarter": (
+        "DATEADD(QUARTER, DATEDIFF(QUARTER, 0, CAST(DATEADD(MONTH, 1, simple.order_date) AS" " DATE)), 0)"
+    ),
+    "fiscal_year": (
+        "DATEADD(YEAR, DATEDIFF(YEAR, 0, CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE)), 0)"
+    ),
+    "fiscal_month_of_year_index": (f"EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE))"),
+    "fiscal_month_index": "EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE))",
+    "fiscal_quarter_of_year": "DATEPART(QUARTER, CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE))",
+    "week_index": (
+        f"EXTRACT(WEEK FROM CAST(CAST(DATEADD(DAY, 1, CAST(simple.order_date AS DATE)) AS DATETIME)"
+        f" AS DATE))"
+    ),
+    "week_of_month": (
+        f"EXTRACT(WEEK FROM CAST(simple.order_date AS DATE)) - EXTRACT(WEEK FROM DATEADD(MONTH,"
+        f" DATEDIFF(MONTH, 0, CAST(simple.order_date AS DATE)), 0)) + 1"
+    ),
+    "month_of_year_index": f"EXTRACT(MONTH FROM CAST(simple.order_date AS DATE))",
+    "month_of_year": "LEFT(DATENAME(MONTH, CAST(simple.order_date AS DATE)), 3)",
+    "month_of_year_full_name": "DATENAME(MONTH, CAST(simple.order_date AS DATE))",
+    "quarter_of_year": "DATEPART(QUARTER, CAST(simple.order_date AS DATE))",
+    "hour_of_day": "DATEPART(HOUR, CAST(simple.order_date AS DATETIME))",
+    "day_of_week": "LEFT(DATENAME(WEEKDAY, CAST(simple.order_date AS DATE)), 3)",
+    "day_of_month": "DATEPART(DAY, CAST(simple.order_date AS DATE))",
+    "day_of_year": "DATEPART(Y, CAST(simple.order_date AS DATE))",
+}
+
+_DIM_GROUP_PG = {
+    "time": "CAST(simple.order_date AS TIMESTAMP)",
+    "second": "DATE_TRUNC('SECOND', CAST(simple.order_date AS TIMESTAMP))",
+    "minute": "DATE_TRUNC('MINUTE', CAST(simple.order_date AS TIMESTAMP))",
+    "hour": "DATE_TRUNC('HOUR', CAST(simple.order_date AS TIMESTAMP))",
+    "date": "DATE_TRUNC('DAY', CAST(simple.order_date AS TIMESTAMP))",
+    "week": (  # noqa
+        "DATE_TRUNC('WEEK', CAST(simple.order_date AS TIMESTAMP) + INTERVAL '1' DAY) - INTERVAL" " '1' DAY"
+    ),
+    "month": "DATE_TRUNC('MONTH', CAST(simple.order_date AS TIMESTAMP))",
+    "quarter": "DATE_TRUNC('QUARTER', CAST(simple.order_date AS TIMESTAMP))",
+    "year": "DATE_TRUNC('YEAR', CAST(simple.order_date AS TIMESTAMP))",
+    "fiscal_month": "DATE_TRUNC('MONTH', CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))",  # noqa
+    "fiscal_quarter": (  # noqa
+        "DATE_TRUNC('QUARTER', CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
+    ),
+    "fiscal_year": "DATE_TRUNC('YEAR', CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))",  # noqa
+    "fiscal_month_of_year_index": (  # noqa
+        f"EXTRACT(MONTH FROM CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
+    ),
+    "fiscal_month_index": (  # noqa
+        f"EXTRACT(MONTH FROM CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
+    ),
+    "fiscal_quarter_of_year": (  # noqa
+        "EXTRACT(QUARTER FROM CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
+    ),
+    "week_index": (
+        f"EXTRACT(WEEK FROM CAST(DATE_TRUNC('DAY', CAST(simple.order_date AS TIMESTAMP) + INTERVAL"
+        f" '1' DAY) AS TIMESTAMP))"
+    ),
+    "week_of_month": (  # noqa
+        f"EXTRACT(WEEK FROM CAST(simple.order_date AS TIMESTAMP)) - EXTRACT(WEEK FROM"
+        f" DATE_TRUNC('MONTH', CAST(simple.order_date AS TIMESTAMP))) + 1"
+    ),
+    "month_of_year_index": f"EXTRACT(MONTH FROM CAST(simple.order_date AS TIMESTAMP))",
+    "month_of_year": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')",
+    "month_of_year_full_name": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Month')",
+    "quarter_of_year": "EXTRACT(QUARTER FROM CAST(simple.order_date AS TIMESTAMP))",
+    "hour_of_day": "EXTRACT('HOUR' FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_week": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Dy')",
+    "day_of_month": "EXTRACT('DAY' FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_year": "EXTRACT('DOY' FROM CAST(simple.order_date AS TIMESTAMP))",
+}
+
+_DIM_GROUP_TRINO = {
+    **_DIM_GROUP_PG,
+    "month_of_year": "FORMAT_DATETIME(CAST(simple.order_date AS TIMESTAMP), 'MMM')",
+    "month_of_year_full_name": "FORMAT_DATETIME(CAST(simple.order_date AS TIMESTAMP), 'MMMM')",
+    "hour_of_day": "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_week": "FORMAT_DATETIME(CAST(simple.order_date AS TIMESTAMP), 'EEE')",
+    "day_of_month": "EXTRACT(DAY FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_year": "EXTRACT(DOY FROM CAST(simple.order_date AS TIMESTAMP))",
+}
+
+_DIM_GROUP_DATABRICKS = {
+    **_DIM_GROUP_PG,
+    "fiscal_month": "DATE_TRUNC('MONTH', CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))",
+    "fiscal_quarter": "DATE_TRUNC('QUARTER', CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))",
+    "fiscal_year": "DATE_TRUNC('YEAR', CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))",
+    "fiscal_month_of_year_index": f"EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))",  # noqa
+    "fiscal_month_index": f"EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))",
+    "fiscal_quarter_of_year": "EXTRACT(QUARTER FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))",
+    "month_of_year": "DATE_FORMAT(CAST(simple.order_date AS TIMESTAMP), 'MMM')",
+    "month_of_year_full_name": "DATE_FORMAT(CAST(simple.order_date AS TIMESTAMP), 'MMMM')",
+    "hour_of_day": "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_week": "DATE_FORMAT(CAST(simple.order_date AS TIMESTAMP), 'E')",
+    "day_of_month": "EXTRACT(DAY FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_year": "EXTRACT(DOY FROM CAST(simple.order_date AS TIMESTAMP))",
+}
+
+_DIM_GROUP_DRUID = {
+    **_DIM_GROUP_PG,
+    "month_of_year": "CASE EXTRACT(MONTH FROM CAST(simple.order_date AS TIMESTAMP)) WHEN 1 THEN 'Jan' WHEN 2 THEN 'Feb' WHEN 3 THEN 'Mar' WHEN 4 THEN 'Apr' WHEN 5 THEN 'May' WHEN 6 THEN 'Jun' WHEN 7 THEN 'Jul' WHEN 8 THEN 'Aug' WHEN 9 THEN 'Sep' WHEN 10 THEN 'Oct' WHEN 11 THEN 'Nov' WHEN 12 THEN 'Dec' ELSE 'Invalid Month' END",  # noqa
+    "month_of_year_full_name": "CASE EXTRACT(MONTH FROM CAST(simple.order_date AS TIMESTAMP)) WHEN 1 THEN 'January' WHEN 2 THEN 'February' WHEN 3 THEN 'March' WHEN 4 THEN 'April' WHEN 5 THEN 'May' WHEN 6 THEN 'June' WHEN 7 THEN 'July' WHEN 8 THEN 'August' WHEN 9 THEN 'September' WHEN 10 THEN 'October' WHEN 11 THEN 'November' WHEN 12 THEN 'December' ELSE 'Invalid Month' END",  # noqa
+    "hour_of_day": "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_week": "CASE EXTRACT(DOW FROM CAST(simple.order_date AS TIMESTAMP)) WHEN 1 THEN 'Mon' WHEN 2 THEN 'Tue' WHEN 3 THEN 'Wed' WHEN 4 THEN 'Thu' WHEN 5 THEN 'Fri' WHEN 6 THEN 'Sat' WHEN 7 THEN 'Sun' ELSE 'Invalid Day' END",  # noqa
+    "day_of_month": "EXTRACT(DAY FROM CAST(simple.order_date AS TIMESTAMP))",
+    "day_of_year": "EXTRACT(DOY FROM CAST(simple.order_date AS TIMESTAMP))",
+}
+
+_DIM_GROUP_BQ = {
+    "time": "CAST(simple.order_date AS TIMESTAMP)",
+    "second": "CAST(DATETIME_TRUNC(CAST(simple.order_date AS DATETIME), SECOND) AS TIMESTAMP)",
+    "minute": "CAST(DATETIME_TRUNC(CAST(simple.order_date AS DATETIME), MINUTE) AS TIMESTAMP)",
+    "hour": "CAST(DATETIME_TRUNC(CAST(simple.order_date AS DATETIME), HOUR) AS TIMESTAMP)",
+    "date": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)",
+    "week": (
+        "CAST(CAST(DATE_TRUNC(CAST(simple.order_date AS DATE) + 1, WEEK) - 1 AS TIMESTAMP) AS" " TIMESTAMP)"
+    ),
+    "month": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), MONTH) AS TIMESTAMP)",
+    "quarter": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), QUARTER) AS TIMESTAMP)",
+    "year": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), YEAR) AS TIMESTAMP)",
+    "fiscal_month": (
+        "CAST(DATE_TRUNC(CAST(DATE_ADD(simple.order_date, INTERVAL 1 MONTH) AS DATE), MONTH) AS" " TIMESTAMP)"
+    ),
+    "fiscal_quarter": (
+        "CAST(DATE_TRUNC(CAST(DATE_ADD(simple.order_date, INTERVAL 1 MONTH) AS DATE), QUARTER) AS"
+        " TIMESTAMP)"
+    ),
+    "fiscal_year": (
+        "CAST(DATE_TRUNC(CAST(DATE_ADD(simple.order_date, INTERVAL 1 MONTH) AS DATE), YEAR) AS" " TIMESTAMP)"
+    ),
+    "fiscal_month_of_year_index": (f"EXTRACT(MONTH FROM DATE_ADD(simple.order_date, INTERVAL 1 MONTH))"),
+    "fiscal_month_index": f"EXTRACT(MONTH FROM DATE_ADD(simple.order_date, INTERVAL 1 MONTH))",
+    "fiscal_quarter_of_year": "EXTRACT(QUARTER FROM DATE_ADD(simple.order_date, INTERVAL 1 MONTH))",
+    "week_index": f"EXTRACT(WEEK FROM DATE_TRUNC(CAST(simple.order_date AS DATE) + 1, DAY))",
+    "week_of_month": (
+        f"EXTRACT(WEEK FROM simple.order_date) - EXTRACT(WEEK FROM DATE_TRUNC(CAST(simple.order_date"
+        f" AS DATE), MONTH)) + 1"
+    ),
+    "month_of_year_index": f"EXTRACT(MONTH FROM simple.order_date)",
+    "month_of_year": "LEFT(FORMAT_DATETIME('%B', CAST(simple.order_date as DATETIME)), 3)",
+    "month_of_year_full_name": "FORMAT_DATETIME('%B', CAST(simple.order_date as DATETIME))",
+    "quarter_of_year": "EXTRACT(QUARTER FROM simple.order_date)",
+    "hour_of_day": f"CAST(CAST(simple.order_date AS STRING FORMAT 'HH24') AS INT64)",
+    "day_of_week": f"CAST(simple.order_date AS STRING FORMAT 'DAY')",
+    "day_of_month": "EXTRACT(DAY FROM simple.order_date)",
+    "day_of_year": "EXTRACT(DAYOFYEAR FROM simple.order_date)",
+}
+
+_DIM_GROUP_BY_DIALECT = {
+    Definitions.snowflake: _DIM_GROUP_SF,
+    Definitions.redshift: _DIM_GROUP_SF,
+    Definitions.sql_server: _DIM_GROUP_SQL_SERVER,
+    Definitions.azure_synapse: _DIM_GROUP_SQL_SERVER,
+    Definitions.postgres: _DIM_GROUP_PG,
+    Definitions.duck_db: _DIM_GROUP_PG,
+    Definitions.trino: _DIM_GROUP_TRINO,
+    Definitions.databricks: _DIM_GROUP_DATABRICKS,
+    Definitions.druid: _DIM_GROUP_DRUID,
+    Definitions.bigquery: _DIM_GROUP_BQ,
+}
+
+
+_DIM_GROUP_CASES = [
+    ("time", Definitions.snowflake),
+    ("second", Definitions.snowflake),
+    ("minute", Definitions.snowflake),
+    ("hour", Definitions.snowflake),
+    ("date", Definitions.snowflake),
+    ("week", Definitions.snowflake),
+    ("month", Definitions.snowflake),
+    ("quarter", Definitions.snowflake),
+    ("year", Definitions.snowflake),
+    ("fiscal_month", Definitions.snowflake),
+    ("fiscal_quarter", Definitions.snowflake),
+    ("fiscal_year", Definitions.snowflake),
+    ("fiscal_month_of_year_index", Definitions.snowflake),
+    ("fiscal_month_index", Definitions.snowflake),
+    ("fiscal_quarter_of_year", Definitions.snowflake),
+    ("week_index", Definitions.snowflake),
+    ("week_of_year", Definitions.snowflake),
+    ("week_of_month", Definitions.snowflake),
+    ("month_of_year_index", Definitions.snowflake),
+    ("month_index", Definitions.snowflake),
+    ("month_of_year", Definitions.snowflake),
+    ("month_of_year_full_name", Definitions.snowflake),
+    ("month_name", Definitions.snowflake),
+    ("quarter_of_year", Definitions.snowflake),
+    ("hour_of_day", Definitions.snowflake),
+    ("day_of_week", Definitions.snowflake),
+    ("day_of_month", Definitions.snowflake),
+    ("day_of_year", Definitions.snowflake),
+    ("time", Definitions.databricks),
+    ("second", Definitions.databricks),
+    ("minute", Definitions.databricks),
+    ("hour", Definitions.databricks),
+    ("date", Definitions.databricks),
+    ("week", Definitions.databricks),
+    ("month", Definitions.databricks),
+    ("quarter", Definitions.databricks),
+    ("year", Definitions.databricks),
+    ("fiscal_month", Definitions.databricks),
+    ("fiscal_quarter", Definitions.databricks),
+    ("fiscal_year", Definitions.databricks),
+    ("fiscal_month_of_year_index", Definitions.databricks),
+    ("fiscal_month_index", Definitions.databricks),
+    ("fiscal_quarter_of_year", Definitions.databricks),
+    ("week_index", Definitions.databricks),
+    ("week_of_month", Definitions.databricks),
+    ("month_of_year_index", Definitions.databricks),
+    ("month_of_year", Definitions.databricks),
+    ("month_of_year_full_name", Definitions.databricks),
+    ("quarter_of_year", Definitions.databricks),
+    ("hour_of_day", Definitions.databricks),
+    ("day_of_week", Definitions.databricks),
+    ("day_of_month", Definitions.databricks),
+    ("day_of_year", Definitions.databricks),
+    ("time", Definitions.druid),
+    ("second", Definitions.druid),
+    ("minute", Definitions.druid),
+    ("hour", Definitions.druid),
+    ("date", Definitions.druid),
+    ("week", Definitions.druid),
+    ("month", Definitions.druid),
+    ("quarter", Definitions.druid),
+    ("year", Definitions.druid),
+    ("fiscal_month", Definitions.druid),
+    ("fiscal_quarter", Definitions.druid),
+    ("fiscal_year", Definitions.druid),
+    ("fiscal_month_of_year_index", Definitions.druid),
+    ("fiscal_month_index", Definitions.druid),
+    ("fiscal_quarter_of_year", Definitions.druid),
+    ("week_index", Definitions.druid),
+    ("week_of_month", Definitions.druid),
+    ("month_of_year_index", Definitions.druid),
+    ("month_of_year", Definitions.druid),
+    ("month_of_year_full_name", Definitions.druid),
+    ("quarter_of_year", Definitions.druid),
+    ("hour_of_day", Definitions.druid),
+    ("day_of_week", Definitions.druid),
+    ("day_of_month", Definitions.druid),
+    ("day_of_year", Definitions.druid),
+    ("time", Definitions.sql_server),
+    ("second", Definitions.sql_server),
+    ("minute", Definitions.sql_server),
+    ("hour", Definitions.sql_server),
+    ("date", Definitions.sql_server),
+    ("week", Definitions.sql_server),
+    ("month", Definitions.sql_server),
+    ("quarter", Definitions.sql_server),
+    ("year", Definitions.sql_server),
+    ("fiscal_month", Definitions.sql_server),
+    ("fiscal_quarter", Definitions.sql_server),
+    ("fiscal_year", Definitions.sql_server),
+    ("fiscal_month_of_year_index", Definitions.sql_server),
+    ("fiscal_month_index", Definitions.sql_server),
+    ("fiscal_quarter_of_year", Definitions.sql_server),
+    ("week_index", Definitions.sql_server),
+    ("week_of_month", Definitions.sql_server),
+    ("month_of_year_index", Definitions.sql_server),
+    ("month_of_year", Definitions.sql_server),
+    ("month_of_year_full_name", Definitions.sql_server),
+    ("quarter_of_year", Definitions.sql_server),
+    ("hour_of_day", Definitions.sql_server),
+    ("day_of_week", Definitions.sql_server),
+    ("day_of_month", Definitions.sql_server),
+    ("day_of_year", Definitions.sql_server),
+    ("time", Definitions.azure_synapse),
+    ("second", Definitions.azure_synapse),
+    ("minute", Definitions.azure_synapse),
+    ("hour", Definitions.azure_synapse),
+    ("date", Definitions.azure_synapse),
+    ("week", Definitions.azure_synapse),
+    ("month", Definitions.azure_synapse),
+    ("quarter", Definitions.azure_synapse),
+    ("year", Definitions.azure_synapse),
+    ("fiscal_month", Definitions.azure_synapse),
+    ("fiscal_quarter", Definitions.azure_synapse),
+    ("fiscal_year", Definitions.azure_synapse),
+    ("fiscal_month_of_year_index", Definitions.azure_synapse),
+    ("fiscal_month_index", Definitions.azure_synapse),
+    ("fiscal_quarter_of_year", Definitions.azure_synapse),
+    ("week_index", Definitions.azure_synapse),
+    ("week_of_month", Definitions.azure_synapse),
+    ("month_of_year_index", Definitions.azure_synapse),
+    ("month_of_year", Definitions.azure_synapse),
+    ("month_of_year_full_name", Definitions.azure_synapse),
+    ("quarter_of_year", Definitions.azure_synapse),
+    ("hour_of_day", Definitions.azure_synapse),
+    ("day_of_week", Definitions.azure_synapse),
+    ("day_of_month", Definitions.azure_synapse),
+    ("day_of_year", Definitions.azure_synapse),
+    ("time", Definitions.redshift),
+    ("second", Definitions.redshift),
+    ("minute", Definitions.redshift),
+    ("hour", Definitions.redshift),
+    ("date", Definitions.redshift),
+    ("week", Definitions.redshift),
+    ("month", Definitions.redshift),
+    ("quarter", Definitions.redshift),
+    ("year", Definitions.redshift),
+    ("fiscal_month", Definitions.redshift),
+    ("fiscal_quarter", Definitions.redshift),
+    ("fiscal_year", Definitions.redshift),
+    ("fiscal_month_of_year_index", Definitions.redshift),
+    ("fiscal_month_index", Definitions.redshift),
+    ("fiscal_quarter_of_year", Definitions.redshift),
+    ("week_index", Definitions.redshift),
+    ("week_of_month", Definitions.redshift),
+    ("month_of_year_index", Definitions.redshift),
+    ("month_of_year", Definitions.redshift),
+    ("month_of_year_full_name", Definitions.redshift),
+    ("quarter_of_year", Definitions.redshift),
+    ("hour_of_day", Definitions.redshift),
+    ("day_of_week", Definitions.redshift),
+    ("day_of_month", Definitions.redshift),
+    ("day_of_year", Definitions.redshift),
+    ("time", Definitions.postgres),
+    ("second", Definitions.postgres),
+    ("minute", Definitions.postgres),
+    ("hour", Definitions.postgres),
+    ("date", Definitions.postgres),
+    ("week", Definitions.postgres),
+    ("month", Definitions.postgres),
+    ("quarter", Definitions.postgres),
+    ("year", Definitions.postgres),
+    ("fiscal_month", Definitions.postgres),
+    ("fiscal_quarter", Definitions.postgres),
+    ("fiscal_year", Definitions.postgres),
+    ("fiscal_month_of_year_index", Definitions.postgres),
+    ("fiscal_month_index", Definitions.postgres),
+    ("fiscal_quarter_of_year", Definitions.postgres),
+    ("week_index", Definitions.postgres),
+    ("week_of_month", Definitions.postgres),
+    ("month_of_year_index", Definitions.postgres),
+    ("month_of_year", Definitions.postgres),
+    ("month_of_year_full_name", Definitions.postgres),
+    ("quarter_of_year", Definitions.postgres),
+    ("hour_of_day", Definitions.postgres),
+    ("day_of_week", Definitions.postgres),
+    ("day_of_month", Definitions.postgres),
+    ("day_of_year", Definitions.postgres),
+    ("time", Definitions.trino),
+    ("second", Definitions.trino),
+    ("minute", Definitions.trino),
+    ("hour", Definitions.trino),
+    ("date", Definitions.trino),
+    ("week", Definitions.trino),
+    ("month", Definitions.trino),
+    ("quarter", Definitions.trino),
+    ("year", Definitions.trino),
+    ("fiscal_month", Definitions.trino),
+    ("fiscal_quarter", Definitions.trino),
+    ("fiscal_year", Definitions.trino),
+    ("fiscal_month_of_year_index", Definitions.trino),
+    ("fiscal_month_index", Definitions.trino),
+    ("fiscal_quarter_of_year", Definitions.trino),
+    ("week_index", Definitions.trino),
+    ("week_of_month", Definitions.trino),
+    ("month_of_year_index", Definitions.trino),
+    ("month_of_year", Definitions.trino),
+    ("month_of_year_full_name", Definitions.trino),
+    ("quarter_of_year", Definitions.trino),
+    ("hour_of_day", Definitions.trino),
+    ("day_of_week", Definitions.trino),
+    ("day_of_month", Definitions.trino),
+    ("day_of_year", Definitions.trino),
+    ("time", Definitions.duck_db),
+    ("second", Definitions.duck_db),
+    ("minute", Definitions.duck_db),
+    ("hour", Definitions.duck_db),
+    ("date", Definitions.duck_db),
+    ("week", Definitions.duck_db),
+    ("month", Definitions.duck_db),
+    ("quarter", Definitions.duck_db),
+    ("year", Definitions.duck_db),
+    ("fiscal_month", Definitions.duck_db),
+    ("fiscal_quarter", Definitions.duck_db),
+    ("fiscal_year", Definitions.duck_db),
+    ("fiscal_month_of_year_index", Definitions.duck_db),
+    ("fiscal_month_index", Definitions.duck_db),
+    ("fiscal_quarter_of_year", Definitions.duck_db),
+    ("week_index", Definitions.duck_db),
+    ("week_of_month", Definitions.duck_db),
+    ("month_of_year_index", Definitions.duck_db),
+    ("month_of_year", Definitions.duck_db),
+    ("month_of_year_full_name", Definitions.duck_db),
+    ("quarter_of_year", Definitions.duck_db),
+    ("hour_of_day", Definitions.duck_db),
+    ("day_of_week", Definitions.duck_db),
+    ("day_of_month", Definitions.duck_db),
+    ("day_of_year", Definitions.duck_db),
+    ("time", Definitions.bigquery),
+    ("second", Definitions.bigquery),
+    ("minute", Definitions.bigquery),
+    ("hour", Definitions.bigquery),
+    ("date", Definitions.bigquery),
+    ("week", Definitions.bigquery),
+    ("month", Definitions.bigquery),
+    ("quarter", Definitions.bigquery),
+    ("year", Definitions.bigquery),
+    ("fiscal_month", Definitions.bigquery),
+    ("fiscal_quarter", Definitions.bigquery),
+    ("fiscal_year", Definitions.bigquery),
+    ("fiscal_month_of_year_index", Definitions.bigquery),
+    ("fiscal_month_index", Definitions.bigquery),
+    ("fiscal_quarter_of_year", Definitions.bigquery),
+    ("week_index", Definitions.bigquery),
+    ("week_of_month", Definitions.bigquery),
+    ("month_of_year_index", Definitions.bigquery),
+    ("month_of_year", Definitions.bigquery),
+    ("month_of_year_full_name", Definitions.bigquery),
+    ("quarter_of_year", Definitions.bigquery),
+    ("hour_of_day", Definitions.bigquery),
+    ("day_of_week", Definitions.bigquery),
+    ("day_of_month", Definitions.bigquery),
+    ("day_of_year", Definitions.bigquery),
+]
+
+
+def _expected_revenue_by(select: str, alias: str, query_type: str):
+    semi = ";" if query_type not in _NO_SEMICOLON else ""
+    if query_type in _DEFAULT_NULLS_LAST:
+        order_by = _ORDER_DESC
+    else:
+        order_by = ""
+    group_by = alias if query_type == Definitions.bigquery else select
+    return (
+        f"SELECT {select} as {alias},SUM(simple.revenue) as simple_total_revenue "
+        f"FROM analytics.orders simple GROUP BY {group_by}{order_by}{semi}"
+    )
+
+
+# The expected SQL is formatted once at import so each case is a dict lookup
+_EXPECTED_DIM_GROUP = {
+    (group, query_type): _expected_revenue_by(
+        _DIM_GROUP_BY_DIALECT[query_type][group], f"simple_order_{group}", query_type
+    )
+    for group, query_type in _DIM_GROUP_CASES
+}
+
+
 @pytest.mark.parametrize(
-    "group,query_type",
-    [
-        ("time", Definitions.snowflake),
-        ("second", Definitions.snowflake),
-        ("minute", Definitions.snowflake),
-        ("hour", Definitions.snowflake),
-        ("date", Definitions.snowflake),
-        ("week", Definitions.snowflake),
-        ("month", Definitions.snowflake),
-        ("quarter", Definitions.snowflake),
-        ("year", Definitions.snowflake),
-        ("fiscal_month", Definitions.snowflake),
-        ("fiscal_quarter", Definitions.snowflake),
-        ("fiscal_year", Definitions.snowflake),
-        ("fiscal_month_of_year_index", Definitions.snowflake),
-        ("fiscal_month_index", Definitions.snowflake),
-        ("fiscal_quarter_of_year", Definitions.snowflake),
-        ("week_index", Definitions.snowflake),
-        ("week_of_year", Definitions.snowflake),
-        ("week_of_month", Definitions.snowflake),
-        ("month_of_year_index", Definitions.snowflake),
-        ("month_index", Definitions.snowflake),
-        ("month_of_year", Definitions.snowflake),
-        ("month_of_year_full_name", Definitions.snowflake),
-        ("month_name", Definitions.snowflake),
-        ("quarter_of_year", Definitions.snowflake),
-        ("hour_of_day", Definitions.snowflake),
-        ("day_of_week", Definitions.snowflake),
-        ("day_of_month", Definitions.snowflake),
-        ("day_of_year", Definitions.snowflake),
-        ("time", Definitions.databricks),
-        ("second", Definitions.databricks),
-        ("minute", Definitions.databricks),
-        ("hour", Definitions.databricks),
-        ("date", Definitions.databricks),
-        ("week", Definitions.databricks),
-        ("month", Definitions.databricks),
-        ("quarter", Definitions.databricks),
-        ("year", Definitions.databricks),
-        ("fiscal_month", Definitions.databricks),
-        ("fiscal_quarter", Definitions.databricks),
-        ("fiscal_year", Definitions.databricks),
-        ("fiscal_month_of_year_index", Definitions.databricks),
-        ("fiscal_month_index", Definitions.databricks),
-        ("fiscal_quarter_of_year", Definitions.databricks),
-        ("week_index", Definitions.databricks),
-        ("week_of_month", Definitions.databricks),
-        ("month_of_year_index", Definitions.databricks),
-        ("month_of_year", Definitions.databricks),
-        ("month_of_year_full_name", Definitions.databricks),
-        ("quarter_of_year", Definitions.databricks),
-        ("hour_of_day", Definitions.databricks),
-        ("day_of_week", Definitions.databricks),
-        ("day_of_month", Definitions.databricks),
-        ("day_of_year", Definitions.databricks),
-        ("time", Definitions.druid),
-        ("second", Definitions.druid),
-        ("minute", Definitions.druid),
-        ("hour", Definitions.druid),
-        ("date", Definitions.druid),
-        ("week", Definitions.druid),
-        ("month", Definitions.druid),
-        ("quarter", Definitions.druid),
-        ("year", Definitions.druid),
-        ("fiscal_month", Definitions.druid),
-        ("fiscal_quarter", Definitions.druid),
-        ("fiscal_year", Definitions.druid),
-        ("fiscal_month_of_year_index", Definitions.druid),
-        ("fiscal_month_index", Definitions.druid),
-        ("fiscal_quarter_of_year", Definitions.druid),
-        ("week_index", Definitions.druid),
-        ("week_of_month", Definitions.druid),
-        ("month_of_year_index", Definitions.druid),
-        ("month_of_year", Definitions.druid),
-        ("month_of_year_full_name", Definitions.druid),
-        ("quarter_of_year", Definitions.druid),
-        ("hour_of_day", Definitions.druid),
-        ("day_of_week", Definitions.druid),
-        ("day_of_month", Definitions.druid),
-        ("day_of_year", Definitions.druid),
-        ("time", Definitions.sql_server),
-        ("second", Definitions.sql_server),
-        ("minute", Definitions.sql_server),
-        ("hour", Definitions.sql_server),
-        ("date", Definitions.sql_server),
-        ("week", Definitions.sql_server),
-        ("month", Definitions.sql_server),
-        ("quarter", Definitions.sql_server),
-        ("year", Definitions.sql_server),
-        ("fiscal_month", Definitions.sql_server),
-        ("fiscal_quarter", Definitions.sql_server),
-        ("fiscal_year", Definitions.sql_server),
-        ("fiscal_month_of_year_index", Definitions.sql_server),
-        ("fiscal_month_index", Definitions.sql_server),
-        ("fiscal_quarter_of_year", Definitions.sql_server),
-        ("week_index", Definitions.sql_server),
-        ("week_of_month", Definitions.sql_server),
-        ("month_of_year_index", Definitions.sql_server),
-        ("month_of_year", Definitions.sql_server),
-        ("month_of_year_full_name", Definitions.sql_server),
-        ("quarter_of_year", Definitions.sql_server),
-        ("hour_of_day", Definitions.sql_server),
-        ("day_of_week", Definitions.sql_server),
-        ("day_of_month", Definitions.sql_server),
-        ("day_of_year", Definitions.sql_server),
-        ("time", Definitions.azure_synapse),
-        ("second", Definitions.azure_synapse),
-        ("minute", Definitions.azure_synapse),
-        ("hour", Definitions.azure_synapse),
-        ("date", Definitions.azure_synapse),
-        ("week", Definitions.azure_synapse),
-        ("month", Definitions.azure_synapse),
-        ("quarter", Definitions.azure_synapse),
-        ("year", Definitions.azure_synapse),
-        ("fiscal_month", Definitions.azure_synapse),
-        ("fiscal_quarter", Definitions.azure_synapse),
-        ("fiscal_year", Definitions.azure_synapse),
-        ("fiscal_month_of_year_index", Definitions.azure_synapse),
-        ("fiscal_month_index", Definitions.azure_synapse),
-        ("fiscal_quarter_of_year", Definitions.azure_synapse),
-        ("week_index", Definitions.azure_synapse),
-        ("week_of_month", Definitions.azure_synapse),
-        ("month_of_year_index", Definitions.azure_synapse),
-        ("month_of_year", Definitions.azure_synapse),
-        ("month_of_year_full_name", Definitions.azure_synapse),
-        ("quarter_of_year", Definitions.azure_synapse),
-        ("hour_of_day", Definitions.azure_synapse),
-        ("day_of_week", Definitions.azure_synapse),
-        ("day_of_month", Definitions.azure_synapse),
-        ("day_of_year", Definitions.azure_synapse),
-        ("time", Definitions.redshift),
-        ("second", Definitions.redshift),
-        ("minute", Definitions.redshift),
-        ("hour", Definitions.redshift),
-        ("date", Definitions.redshift),
-        ("week", Definitions.redshift),
-        ("month", Definitions.redshift),
-        ("quarter", Definitions.redshift),
-        ("year", Definitions.redshift),
-        ("fiscal_month", Definitions.redshift),
-        ("fiscal_quarter", Definitions.redshift),
-        ("fiscal_year", Definitions.redshift),
-        ("fiscal_month_of_year_index", Definitions.redshift),
-        ("fiscal_month_index", Definitions.redshift),
-        ("fiscal_quarter_of_year", Definitions.redshift),
-        ("week_index", Definitions.redshift),
-        ("week_of_month", Definitions.redshift),
-        ("month_of_year_index", Definitions.redshift),
-        ("month_of_year", Definitions.redshift),
-        ("month_of_year_full_name", Definitions.redshift),
-        ("quarter_of_year", Definitions.redshift),
-        ("hour_of_day", Definitions.redshift),
-        ("day_of_week", Definitions.redshift),
-        ("day_of_month", Definitions.redshift),
-        ("day_of_year", Definitions.redshift),
-        ("time", Definitions.postgres),
-        ("second", Definitions.postgres),
-        ("minute", Definitions.postgres),
-        ("hour", Definitions.postgres),
-        ("date", Definitions.postgres),
-        ("week", Definitions.postgres),
-        ("month", Definitions.postgres),
-        ("quarter", Definitions.postgres),
-        ("year", Definitions.postgres),
-        ("fiscal_month", Definitions.postgres),
-        ("fiscal_quarter", Definitions.postgres),
-        ("fiscal_year", Definitions.postgres),
-        ("fiscal_month_of_year_index", Definitions.postgres),
-        ("fiscal_month_index", Definitions.postgres),
-        ("fiscal_quarter_of_year", Definitions.postgres),
-        ("week_index", Definitions.postgres),
-        ("week_of_month", Definitions.postgres),
-        ("month_of_year_index", Definitions.postgres),
-        ("month_of_year", Definitions.postgres),
-        ("month_of_year_full_name", Definitions.postgres),
-        ("quarter_of_year", Definitions.postgres),
-        ("hour_of_day", Definitions.postgres),
-        ("day_of_week", Definitions.postgres),
-        ("day_of_month", Definitions.postgres),
-        ("day_of_year", Definitions.postgres),
-        ("time", Definitions.trino),
-        ("second", Definitions.trino),
-        ("minute", Definitions.trino),
-        ("hour", Definitions.trino),
-        ("date", Definitions.trino),
-        ("week", Definitions.trino),
-        ("month", Definitions.trino),
-        ("quarter", Definitions.trino),
-        ("year", Definitions.trino),
-        ("fiscal_month", Definitions.trino),
-        ("fiscal_quarter", Definitions.trino),
-        ("fiscal_year", Definitions.trino),
-        ("fiscal_month_of_year_index", Definitions.trino),
-        ("fiscal_month_index", Definitions.trino),
-        ("fiscal_quarter_of_year", Definitions.trino),
-        ("week_index", Definitions.trino),
-        ("week_of_month", Definitions.trino),
-        ("month_of_year_index", Definitions.trino),
-        ("month_of_year", Definitions.trino),
-        ("month_of_year_full_name", Definitions.trino),
-        ("quarter_of_year", Definitions.trino),
-        ("hour_of_day", Definitions.trino),
-        ("day_of_week", Definitions.trino),
-        ("day_of_month", Definitions.trino),
-        ("day_of_year", Definitions.trino),
-        ("time", Definitions.duck_db),
-        ("second", Definitions.duck_db),
-        ("minute", Definitions.duck_db),
-        ("hour", Definitions.duck_db),
-        ("date", Definitions.duck_db),
-        ("week", Definitions.duck_db),
-        ("month", Definitions.duck_db),
-        ("quarter", Definitions.duck_db),
-        ("year", Definitions.duck_db),
-        ("fiscal_month", Definitions.duck_db),
-        ("fiscal_quarter", Definitions.duck_db),
-        ("fiscal_year", Definitions.duck_db),
-        ("fiscal_month_of_year_index", Definitions.duck_db),
-        ("fiscal_month_index", Definitions.duck_db),
-        ("fiscal_quarter_of_year", Definitions.duck_db),
-        ("week_index", Definitions.duck_db),
-        ("week_of_month", Definitions.duck_db),
-        ("month_of_year_index", Definitions.duck_db),
-        ("month_of_year", Definitions.duck_db),
-        ("month_of_year_full_name", Definitions.duck_db),
-        ("quarter_of_year", Definitions.duck_db),
-        ("hour_of_day", Definitions.duck_db),
-        ("day_of_week", Definitions.duck_db),
-        ("day_of_month", Definitions.duck_db),
-        ("day_of_year", Definitions.duck_db),
-        ("time", Definitions.bigquery),
-        ("second", Definitions.bigquery),
-        ("minute", Definitions.bigquery),
-        ("hour", Definitions.bigquery),
-        ("date", Definitions.bigquery),
-        ("week", Definitions.bigquery),
-        ("month", Definitions.bigquery),
-        ("quarter", Definitions.bigquery),
-        ("year", Definitions.bigquery),
-        ("fiscal_month", Definitions.bigquery),
-        ("fiscal_quarter", Definitions.bigquery),
-        ("fiscal_year", Definitions.bigquery),
-        ("fiscal_month_of_year_index", Definitions.bigquery),
-        ("fiscal_month_index", Definitions.bigquery),
-        ("fiscal_quarter_of_year", Definitions.bigquery),
-        ("week_index", Definitions.bigquery),
-        ("week_of_month", Definitions.bigquery),
-        ("month_of_year_index", Definitions.bigquery),
-        ("month_of_year", Definitions.bigquery),
-        ("month_of_year_full_name", Definitions.bigquery),
-        ("quarter_of_year", Definitions.bigquery),
-        ("hour_of_day", Definitions.bigquery),
-        ("day_of_week", Definitions.bigquery),
-        ("day_of_month", Definitions.bigquery),
-        ("day_of_year", Definitions.bigquery),
-    ],
+    "group,query_type", _DIM_GROUP_CASES, ids=[f"{group}-{qt}" for group, qt in _DIM_GROUP_CASES]
 )
 @pytest.mark.query
-def test_simple_query_dimension_group(connections, group: str, query_type: str):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_dimension_group(simple_conn, group: str, query_type: str):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"], dimensions=[f"order_{group}"], query_type=query_type
     )
-    field = project.get_field(f"order_{group}")
+    assert query == _EXPECTED_DIM_GROUP[(group, query_type)]
 
-    semi = ";" if query_type not in Definitions.no_semicolon_warehouses else ""
-    if query_type in {Definitions.snowflake, Definitions.redshift}:
-        result_lookup = {
-            "time": "CAST(simple.order_date AS TIMESTAMP)",
-            "second": "DATE_TRUNC('SECOND', simple.order_date)",
-            "minute": "DATE_TRUNC('MINUTE', simple.order_date)",
-            "hour": "DATE_TRUNC('HOUR', simple.order_date)",
-            "date": "DATE_TRUNC('DAY', simple.order_date)",
-            "week": "DATE_TRUNC('WEEK', CAST(simple.order_date AS DATE) + 1) - 1",
-            "month": "DATE_TRUNC('MONTH', simple.order_date)",
-            "quarter": "DATE_TRUNC('QUARTER', simple.order_date)",
-            "year": "DATE_TRUNC('YEAR', simple.order_date)",
-            "fiscal_month": "DATE_TRUNC('MONTH', DATEADD(MONTH, 1, simple.order_date))",
-            "fiscal_quarter": "DATE_TRUNC('QUARTER', DATEADD(MONTH, 1, simple.order_date))",
-            "fiscal_year": "DATE_TRUNC('YEAR', DATEADD(MONTH, 1, simple.order_date))",
-            "fiscal_month_of_year_index": f"EXTRACT(MONTH FROM DATEADD(MONTH, 1, simple.order_date))",
-            "fiscal_month_index": f"EXTRACT(MONTH FROM DATEADD(MONTH, 1, simple.order_date))",
-            "fiscal_quarter_of_year": "EXTRACT(QUARTER FROM DATEADD(MONTH, 1, simple.order_date))",
-            "week_index": f"EXTRACT(WEEK FROM DATE_TRUNC('DAY', CAST(simple.order_date AS DATE) + 1))",
-            "week_of_year": f"EXTRACT(WEEK FROM DATE_TRUNC('DAY', CAST(simple.order_date AS DATE) + 1))",
-            "week_of_month": (
-                f"EXTRACT(WEEK FROM simple.order_date) -"
-                f" EXTRACT(WEEK FROM DATE_TRUNC('MONTH', simple.order_date)) + 1"
-            ),
-            "month_of_year_index": f"EXTRACT(MONTH FROM simple.order_date)",
-            "month_index": f"EXTRACT(MONTH FROM simple.order_date)",
-            "month_of_year": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')",
-            "month_name": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')",
-            "month_of_year_full_name": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'MMMM')",
-            "quarter_of_year": "EXTRACT(QUARTER FROM simple.order_date)",
-            "hour_of_day": "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))",
-            "day_of_week": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Dy')",
-            "day_of_month": "EXTRACT(DAY FROM simple.order_date)",
-            "day_of_year": "EXTRACT(DOY FROM simple.order_date)",
-        }
-        if query_type == Definitions.redshift:
-            result_lookup["month_of_year"] = "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')"
-            result_lookup["month_name"] = "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')"
-        order_by = " ORDER BY simple_total_revenue DESC NULLS LAST"
+    field = simple_conn.project.get_field(f"order_{group}")
+    assert field.label == f"Order Created {group.replace('_', ' ').title()}"
 
-    elif query_type in {Definitions.sql_server, Definitions.azure_synapse}:
-        result_lookup = {
-            "time": "CAST(simple.order_date AS DATETIME)",
-            "second": "DATEADD(SECOND, DATEDIFF(SECOND, 0, CAST(simple.order_date AS DATETIME)), 0)",
-            "minute": "DATEADD(MINUTE, DATEDIFF(MINUTE, 0, CAST(simple.order_date AS DATETIME)), 0)",
-            "hour": "DATEADD(HOUR, DATEDIFF(HOUR, 0, CAST(simple.order_date AS DATETIME)), 0)",
-            "date": "CAST(CAST(simple.order_date AS DATE) AS DATETIME)",
-            "week": (  # noqa
-                "DATEADD(DAY, -1, DATEADD(WEEK, DATEDIFF(WEEK, 0, DATEADD(DAY, 1, CAST(simple.order_date AS"
-                " DATE))), 0))"
-            ),
-            "month": "DATEADD(MONTH, DATEDIFF(MONTH, 0, CAST(simple.order_date AS DATE)), 0)",
-            "quarter": "DATEADD(QUARTER, DATEDIFF(QUARTER, 0, CAST(simple.order_date AS DATE)), 0)",
-            "year": "DATEADD(YEAR, DATEDIFF(YEAR, 0, CAST(simple.order_date AS DATE)), 0)",
-            "fiscal_month": (
-                "DATEADD(MONTH, DATEDIFF(MONTH, 0, CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE)), 0)"
-            ),
-            "fiscal_quarter": (
-                "DATEADD(QUARTER, DATEDIFF(QUARTER, 0, CAST(DATEADD(MONTH, 1, simple.order_date) AS"
-                " DATE)), 0)"
-            ),
-            "fiscal_year": (
-                "DATEADD(YEAR, DATEDIFF(YEAR, 0, CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE)), 0)"
-            ),
-            "fiscal_month_of_year_index": (
-                f"EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE))"
-            ),
-            "fiscal_month_index": "EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE))",
-            "fiscal_quarter_of_year": "DATEPART(QUARTER, CAST(DATEADD(MONTH, 1, simple.order_date) AS DATE))",
-            "week_index": (
-                f"EXTRACT(WEEK FROM CAST(CAST(DATEADD(DAY, 1, CAST(simple.order_date AS DATE)) AS DATETIME)"
-                f" AS DATE))"
-            ),
-            "week_of_month": (
-                f"EXTRACT(WEEK FROM CAST(simple.order_date AS DATE)) - EXTRACT(WEEK FROM DATEADD(MONTH,"
-                f" DATEDIFF(MONTH, 0, CAST(simple.order_date AS DATE)), 0)) + 1"
-            ),
-            "month_of_year_index": f"EXTRACT(MONTH FROM CAST(simple.order_date AS DATE))",
-            "month_of_year": "LEFT(DATENAME(MONTH, CAST(simple.order_date AS DATE)), 3)",
-            "month_of_year_full_name": "DATENAME(MONTH, CAST(simple.order_date AS DATE))",
-            "quarter_of_year": "DATEPART(QUARTER, CAST(simple.order_date AS DATE))",
-            "hour_of_day": "DATEPART(HOUR, CAST(simple.order_date AS DATETIME))",
-            "day_of_week": "LEFT(DATENAME(WEEKDAY, CAST(simple.order_date AS DATE)), 3)",
-            "day_of_month": "DATEPART(DAY, CAST(simple.order_date AS DATE))",
-            "day_of_year": "DATEPART(Y, CAST(simple.order_date AS DATE))",
-        }
-        order_by = ""
 
-    elif query_type in {
-        Definitions.trino,
-        Definitions.postgres,
-        Definitions.databricks,
-        Definitions.druid,
-        Definitions.duck_db,
-    }:
-        result_lookup = {
-            "time": "CAST(simple.order_date AS TIMESTAMP)",
-            "second": "DATE_TRUNC('SECOND', CAST(simple.order_date AS TIMESTAMP))",
-            "minute": "DATE_TRUNC('MINUTE', CAST(simple.order_date AS TIMESTAMP))",
-            "hour": "DATE_TRUNC('HOUR', CAST(simple.order_date AS TIMESTAMP))",
-            "date": "DATE_TRUNC('DAY', CAST(simple.order_date AS TIMESTAMP))",
-            "week": (  # noqa
-                "DATE_TRUNC('WEEK', CAST(simple.order_date AS TIMESTAMP) + INTERVAL '1' DAY) - INTERVAL"
-                " '1' DAY"
-            ),
-            "month": "DATE_TRUNC('MONTH', CAST(simple.order_date AS TIMESTAMP))",
-            "quarter": "DATE_TRUNC('QUARTER', CAST(simple.order_date AS TIMESTAMP))",
-            "year": "DATE_TRUNC('YEAR', CAST(simple.order_date AS TIMESTAMP))",
-            "fiscal_month": "DATE_TRUNC('MONTH', CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))",  # noqa
-            "fiscal_quarter": (  # noqa
-                "DATE_TRUNC('QUARTER', CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
-            ),
-            "fiscal_year": "DATE_TRUNC('YEAR', CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))",  # noqa
-            "fiscal_month_of_year_index": (  # noqa
-                f"EXTRACT(MONTH FROM CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
-            ),
-            "fiscal_month_index": (  # noqa
-                f"EXTRACT(MONTH FROM CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
-            ),
-            "fiscal_quarter_of_year": (  # noqa
-                "EXTRACT(QUARTER FROM CAST(simple.order_date + INTERVAL '1' MONTH AS TIMESTAMP))"
-            ),
-            "week_index": (
-                f"EXTRACT(WEEK FROM CAST(DATE_TRUNC('DAY', CAST(simple.order_date AS TIMESTAMP) + INTERVAL"
-                f" '1' DAY) AS TIMESTAMP))"
-            ),
-            "week_of_month": (  # noqa
-                f"EXTRACT(WEEK FROM CAST(simple.order_date AS TIMESTAMP)) - EXTRACT(WEEK FROM"
-                f" DATE_TRUNC('MONTH', CAST(simple.order_date AS TIMESTAMP))) + 1"
-            ),
-            "month_of_year_index": f"EXTRACT(MONTH FROM CAST(simple.order_date AS TIMESTAMP))",
-            "month_of_year": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Mon')",
-            "month_of_year_full_name": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Month')",
-            "quarter_of_year": "EXTRACT(QUARTER FROM CAST(simple.order_date AS TIMESTAMP))",
-            "hour_of_day": "EXTRACT('HOUR' FROM CAST(simple.order_date AS TIMESTAMP))",
-            "day_of_week": "TO_CHAR(CAST(simple.order_date AS TIMESTAMP), 'Dy')",
-            "day_of_month": "EXTRACT('DAY' FROM CAST(simple.order_date AS TIMESTAMP))",
-            "day_of_year": "EXTRACT('DOY' FROM CAST(simple.order_date AS TIMESTAMP))",
-        }
-        if query_type == Definitions.trino:
-            result_lookup["month_of_year"] = "FORMAT_DATETIME(CAST(simple.order_date AS TIMESTAMP), 'MMM')"
-            result_lookup[
-                "month_of_year_full_name"
-            ] = "FORMAT_DATETIME(CAST(simple.order_date AS TIMESTAMP), 'MMMM')"
-            result_lookup["hour_of_day"] = "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))"
-            result_lookup["day_of_week"] = "FORMAT_DATETIME(CAST(simple.order_date AS TIMESTAMP), 'EEE')"
-            result_lookup["day_of_month"] = "EXTRACT(DAY FROM CAST(simple.order_date AS TIMESTAMP))"
-            result_lookup["day_of_year"] = "EXTRACT(DOY FROM CAST(simple.order_date AS TIMESTAMP))"
+_INTERVAL_SF = {
+    "second": "DATEDIFF('SECOND', simple.view_date, simple.order_date)",
+    "minute": "DATEDIFF('MINUTE', simple.view_date, simple.order_date)",
+    "hour": "DATEDIFF('HOUR', simple.view_date, simple.order_date)",
+    "day": "DATEDIFF('DAY', simple.view_date, simple.order_date)",
+    "week": "DATEDIFF('WEEK', simple.view_date, simple.order_date)",
+    "month": "DATEDIFF('MONTH', simple.view_date, simple.order_date)",
+    "quarter": "DATEDIFF('QUARTER', simple.view_date, simple.order_date)",
+    "year": "DATEDIFF('YEAR', simple.view_date, simple.order_date)",
+}
 
-        if query_type == Definitions.duck_db:
-            order_by = " ORDER BY simple_total_revenue DESC NULLS LAST"
-        else:
-            order_by = ""
+_INTERVAL_TRINO = {
+    "second": "DATE_DIFF('SECOND', simple.view_date, simple.order_date)",
+    "minute": "DATE_DIFF('MINUTE', simple.view_date, simple.order_date)",
+    "hour": "DATE_DIFF('HOUR', simple.view_date, simple.order_date)",
+    "day": "DATE_DIFF('DAY', simple.view_date, simple.order_date)",
+    "week": "DATE_DIFF('WEEK', simple.view_date, simple.order_date)",
+    "month": "DATE_DIFF('MONTH', simple.view_date, simple.order_date)",
+    "quarter": "DATE_DIFF('QUARTER', simple.view_date, simple.order_date)",
+    "year": "DATE_DIFF('YEAR', simple.view_date, simple.order_date)",
+}
 
-        if query_type == Definitions.databricks:
-            result_lookup[
-                "fiscal_month"
-            ] = "DATE_TRUNC('MONTH', CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))"
-            result_lookup[
-                "fiscal_quarter"
-            ] = "DATE_TRUNC('QUARTER', CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))"
-            result_lookup[
-                "fiscal_year"
-            ] = "DATE_TRUNC('YEAR', CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))"
-            result_lookup[
-                "fiscal_month_of_year_index"
-            ] = f"EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))"
-            result_lookup[
-                "fiscal_month_index"
-            ] = f"EXTRACT(MONTH FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))"
-            result_lookup[
-                "fiscal_quarter_of_year"
-            ] = "EXTRACT(QUARTER FROM CAST(DATEADD(MONTH, 1, simple.order_date) AS TIMESTAMP))"
-            result_lookup["month_of_year"] = "DATE_FORMAT(CAST(simple.order_date AS TIMESTAMP), 'MMM')"
-            result_lookup[
-                "month_of_year_full_name"
-            ] = "DATE_FORMAT(CAST(simple.order_date AS TIMESTAMP), 'MMMM')"  # noqa
-            result_lookup["hour_of_day"] = "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))"
-            result_lookup["day_of_week"] = "DATE_FORMAT(CAST(simple.order_date AS TIMESTAMP), 'E')"
-            result_lookup["day_of_month"] = "EXTRACT(DAY FROM CAST(simple.order_date AS TIMESTAMP))"
-            result_lookup["day_of_year"] = "EXTRACT(DOY FROM CAST(simple.order_date AS TIMESTAMP))"
-        if query_type == Definitions.druid:
-            result_lookup[
-                "month_of_year"
-            ] = "CASE EXTRACT(MONTH FROM CAST(simple.order_date AS TIMESTAMP)) WHEN 1 THEN 'Jan' WHEN 2 THEN 'Feb' WHEN 3 THEN 'Mar' WHEN 4 THEN 'Apr' WHEN 5 THEN 'May' WHEN 6 THEN 'Jun' WHEN 7 THEN 'Jul' WHEN 8 THEN 'Aug' WHEN 9 THEN 'Sep' WHEN 10 THEN 'Oct' WHEN 11 THEN 'Nov' WHEN 12 THEN 'Dec' ELSE 'Invalid Month' END"  # noqa
-            result_lookup[
-                "month_of_year_full_name"
-            ] = "CASE EXTRACT(MONTH FROM CAST(simple.order_date AS TIMESTAMP)) WHEN 1 THEN 'January' WHEN 2 THEN 'February' WHEN 3 THEN 'March' WHEN 4 THEN 'April' WHEN 5 THEN 'May' WHEN 6 THEN 'June' WHEN 7 THEN 'July' WHEN 8 THEN 'August' WHEN 9 THEN 'September' WHEN 10 THEN 'October' WHEN 11 THEN 'November' WHEN 12 THEN 'December' ELSE 'Invalid Month' END"  # noqa
-            result_lookup["hour_of_day"] = "EXTRACT(HOUR FROM CAST(simple.order_date AS TIMESTAMP))"
-            result_lookup[
-                "day_of_week"
-            ] = "CASE EXTRACT(DOW FROM CAST(simple.order_date AS TIMESTAMP)) WHEN 1 THEN 'Mon' WHEN 2 THEN 'Tue' WHEN 3 THEN 'Wed' WHEN 4 THEN 'Thu' WHEN 5 THEN 'Fri' WHEN 6 THEN 'Sat' WHEN 7 THEN 'Sun' ELSE 'Invalid Day' END"  # noqa
-            result_lookup["day_of_month"] = "EXTRACT(DAY FROM CAST(simple.order_date AS TIMESTAMP))"
-            result_lookup["day_of_year"] = "EXTRACT(DOY FROM CAST(simple.order_date AS TIMESTAMP))"
-            semi = ""
-    elif query_type == Definitions.bigquery:
-        result_lookup = {
-            "time": "CAST(simple.order_date AS TIMESTAMP)",
-            "second": "CAST(DATETIME_TRUNC(CAST(simple.order_date AS DATETIME), SECOND) AS TIMESTAMP)",
-            "minute": "CAST(DATETIME_TRUNC(CAST(simple.order_date AS DATETIME), MINUTE) AS TIMESTAMP)",
-            "hour": "CAST(DATETIME_TRUNC(CAST(simple.order_date AS DATETIME), HOUR) AS TIMESTAMP)",
-            "date": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)",
-            "week": (
-                "CAST(CAST(DATE_TRUNC(CAST(simple.order_date AS DATE) + 1, WEEK) - 1 AS TIMESTAMP) AS"
-                " TIMESTAMP)"
-            ),
-            "month": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), MONTH) AS TIMESTAMP)",
-            "quarter": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), QUARTER) AS TIMESTAMP)",
-            "year": "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), YEAR) AS TIMESTAMP)",
-            "fiscal_month": (
-                "CAST(DATE_TRUNC(CAST(DATE_ADD(simple.order_date, INTERVAL 1 MONTH) AS DATE), MONTH) AS"
-                " TIMESTAMP)"
-            ),
-            "fiscal_quarter": (
-                "CAST(DATE_TRUNC(CAST(DATE_ADD(simple.order_date, INTERVAL 1 MONTH) AS DATE), QUARTER) AS"
-                " TIMESTAMP)"
-            ),
-            "fiscal_year": (
-                "CAST(DATE_TRUNC(CAST(DATE_ADD(simple.order_date, INTERVAL 1 MONTH) AS DATE), YEAR) AS"
-                " TIMESTAMP)"
-            ),
-            "fiscal_month_of_year_index": (
-                f"EXTRACT(MONTH FROM DATE_ADD(simple.order_date, INTERVAL 1 MONTH))"
-            ),
-            "fiscal_month_index": f"EXTRACT(MONTH FROM DATE_ADD(simple.order_date, INTERVAL 1 MONTH))",
-            "fiscal_quarter_of_year": "EXTRACT(QUARTER FROM DATE_ADD(simple.order_date, INTERVAL 1 MONTH))",
-            "week_index": f"EXTRACT(WEEK FROM DATE_TRUNC(CAST(simple.order_date AS DATE) + 1, DAY))",
-            "week_of_month": (
-                f"EXTRACT(WEEK FROM simple.order_date) - EXTRACT(WEEK FROM DATE_TRUNC(CAST(simple.order_date"
-                f" AS DATE), MONTH)) + 1"
-            ),
-            "month_of_year_index": f"EXTRACT(MONTH FROM simple.order_date)",
-            "month_of_year": "LEFT(FORMAT_DATETIME('%B', CAST(simple.order_date as DATETIME)), 3)",
-            "month_of_year_full_name": "FORMAT_DATETIME('%B', CAST(simple.order_date as DATETIME))",
-            "quarter_of_year": "EXTRACT(QUARTER FROM simple.order_date)",
-            "hour_of_day": f"CAST(CAST(simple.order_date AS STRING FORMAT 'HH24') AS INT64)",
-            "day_of_week": f"CAST(simple.order_date AS STRING FORMAT 'DAY')",
-            "day_of_month": "EXTRACT(DAY FROM simple.order_date)",
-            "day_of_year": "EXTRACT(DAYOFYEAR FROM simple.order_date)",
-        }
-        order_by = ""
-    else:
-        raise ValueError(f"Query type {query_type} not supported")
+_INTERVAL_DRUID = {
+    "second": "TIMESTAMPDIFF(SECOND, simple.view_date, simple.order_date)",
+    "minute": "TIMESTAMPDIFF(MINUTE, simple.view_date, simple.order_date)",
+    "hour": "TIMESTAMPDIFF(HOUR, simple.view_date, simple.order_date)",
+    "day": "TIMESTAMPDIFF(DAY, simple.view_date, simple.order_date)",
+    "week": "TIMESTAMPDIFF(WEEK, simple.view_date, simple.order_date)",
+    "month": "TIMESTAMPDIFF(MONTH, simple.view_date, simple.order_date)",
+    "quarter": "TIMESTAMPDIFF(QUARTER, simple.view_date, simple.order_date)",
+    "year": "TIMESTAMPDIFF(YEAR, simple.view_date, simple.order_date)",
+}
 
-    date_result = result_lookup[group]
+_INTERVAL_SQL_SERVER = {
+    "second": "DATEDIFF(SECOND, simple.view_date, simple.order_date)",
+    "minute": "DATEDIFF(MINUTE, simple.view_date, simple.order_date)",
+    "hour": "DATEDIFF(HOUR, simple.view_date, simple.order_date)",
+    "day": "DATEDIFF(DAY, simple.view_date, simple.order_date)",
+    "week": "DATEDIFF(WEEK, simple.view_date, simple.order_date)",
+    "month": "DATEDIFF(MONTH, simple.view_date, simple.order_date)",
+    "quarter": "DATEDIFF(QUARTER, simple.view_date, simple.order_date)",
+    "year": "DATEDIFF(YEAR, simple.view_date, simple.order_date)",
+}
 
-    correct = (
-        f"SELECT {date_result} as simple_order_{group},SUM(simple.revenue) as "
-        "simple_total_revenue FROM analytics.orders simple "
-        f"GROUP BY {date_result if query_type != Definitions.bigquery else f'simple_order_{group}'}"
-        f"{order_by}{semi}"
-    )
-    print(query)
-    assert query == correct
+_INTERVAL_PG = {
+    "second": (  # noqa
+        "DATE_PART('DAY', AGE(simple.order_date, simple.view_date)) * 24 + DATE_PART('HOUR',"
+        " AGE(simple.order_date, simple.view_date)) * 60 + DATE_PART('MINUTE', AGE(simple.order_date,"
+        " simple.view_date)) * 60 + DATE_PART('SECOND', AGE(simple.order_date, simple.view_date))"
+    ),
+    "minute": (  # noqa
+        "DATE_PART('DAY', AGE(simple.order_date, simple.view_date)) * 24 + DATE_PART('HOUR',"
+        " AGE(simple.order_date, simple.view_date)) * 60 + DATE_PART('MINUTE', AGE(simple.order_date,"
+        " simple.view_date))"
+    ),
+    "hour": (  # noqa
+        "DATE_PART('DAY', AGE(simple.order_date, simple.view_date)) * 24 + DATE_PART('HOUR',"
+        " AGE(simple.order_date, simple.view_date))"
+    ),
+    "day": "DATE_PART('DAY', AGE(simple.order_date, simple.view_date))",
+    "week": "TRUNC(DATE_PART('DAY', AGE(simple.order_date, simple.view_date))/7)",
+    "month": (  # noqa
+        "DATE_PART('YEAR', AGE(simple.order_date, simple.view_date)) * 12 + (DATE_PART('month',"
+        " AGE(simple.order_date, simple.view_date)))"
+    ),
+    "quarter": (  # noqa
+        "DATE_PART('YEAR', AGE(simple.order_date, simple.view_date)) * 4 + TRUNC(DATE_PART('month',"
+        " AGE(simple.order_date, simple.view_date))/3)"
+    ),
+    "year": "DATE_PART('YEAR', AGE(simple.order_date, simple.view_date))",
+}
 
-    correct_label = f"Order Created {group.replace('_', ' ').title()}"
-    assert field.label == correct_label
+_INTERVAL_BQ = {
+    "second": (  # noqa
+        "TIMESTAMP_DIFF(CAST(simple.order_date as TIMESTAMP), CAST(simple.view_date as TIMESTAMP)," " SECOND)"
+    ),
+    "minute": (  # noqa
+        "TIMESTAMP_DIFF(CAST(simple.order_date as TIMESTAMP), CAST(simple.view_date as TIMESTAMP)," " MINUTE)"
+    ),
+    "hour": (  # noqa
+        "TIMESTAMP_DIFF(CAST(simple.order_date as TIMESTAMP), CAST(simple.view_date as TIMESTAMP)," " HOUR)"
+    ),
+    "day": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), DAY)",
+    "week": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), ISOWEEK)",
+    "month": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), MONTH)",
+    "quarter": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), QUARTER)",
+    "year": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), ISOYEAR)",
+}
+
+_INTERVAL_BY_DIALECT = {
+    Definitions.snowflake: _INTERVAL_SF,
+    Definitions.redshift: _INTERVAL_SF,
+    Definitions.duck_db: _INTERVAL_SF,
+    Definitions.trino: _INTERVAL_TRINO,
+    Definitions.druid: _INTERVAL_DRUID,
+    Definitions.sql_server: _INTERVAL_SQL_SERVER,
+    Definitions.azure_synapse: _INTERVAL_SQL_SERVER,
+    Definitions.databricks: _INTERVAL_SQL_SERVER,
+    Definitions.postgres: _INTERVAL_PG,
+    Definitions.bigquery: _INTERVAL_BQ,
+}
+
+_EXPECTED_INTERVAL = {
+    (interval, query_type): _expected_revenue_by(interval_result, f"simple_{interval}s_waiting", query_type)
+    for query_type, results in _INTERVAL_BY_DIALECT.items()
+    for interval, interval_result in results.items()
+}
 
 
 @pytest.mark.parametrize(
@@ -1218,148 +1344,31 @@ def test_simple_query_dimension_group(connections, group: str, query_type: str):
     ],
 )
 @pytest.mark.query
-def test_simple_query_dimension_group_interval(connections, interval: str, query_type: str):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    raises_error = interval == "millisecond" and query_type == Definitions.bigquery
-    if raises_error:
+def test_simple_query_dimension_group_interval(simple_conn, interval: str, query_type: str):
+    if interval == "millisecond" and query_type == Definitions.bigquery:
         with pytest.raises(AccessDeniedOrDoesNotExistException) as exc_info:
-            conn.get_sql_query(
+            simple_conn.get_sql_query(
                 metrics=["total_revenue"],
                 dimensions=[f"{interval}s_waiting"],
                 query_type=query_type,
             )
-    else:
-        query = conn.get_sql_query(
-            metrics=["total_revenue"],
-            dimensions=[f"{interval}s_waiting"],
-            query_type=query_type,
-        )
-        field = project.get_field(f"{interval}s_waiting")
-
-    semi = ";"
-    if query_type in {Definitions.snowflake, Definitions.redshift, Definitions.duck_db}:
-        result_lookup = {
-            "second": "DATEDIFF('SECOND', simple.view_date, simple.order_date)",
-            "minute": "DATEDIFF('MINUTE', simple.view_date, simple.order_date)",
-            "hour": "DATEDIFF('HOUR', simple.view_date, simple.order_date)",
-            "day": "DATEDIFF('DAY', simple.view_date, simple.order_date)",
-            "week": "DATEDIFF('WEEK', simple.view_date, simple.order_date)",
-            "month": "DATEDIFF('MONTH', simple.view_date, simple.order_date)",
-            "quarter": "DATEDIFF('QUARTER', simple.view_date, simple.order_date)",
-            "year": "DATEDIFF('YEAR', simple.view_date, simple.order_date)",
-        }
-        order_by = " ORDER BY simple_total_revenue DESC NULLS LAST"
-    elif query_type == Definitions.trino:
-        result_lookup = {
-            "second": "DATE_DIFF('SECOND', simple.view_date, simple.order_date)",
-            "minute": "DATE_DIFF('MINUTE', simple.view_date, simple.order_date)",
-            "hour": "DATE_DIFF('HOUR', simple.view_date, simple.order_date)",
-            "day": "DATE_DIFF('DAY', simple.view_date, simple.order_date)",
-            "week": "DATE_DIFF('WEEK', simple.view_date, simple.order_date)",
-            "month": "DATE_DIFF('MONTH', simple.view_date, simple.order_date)",
-            "quarter": "DATE_DIFF('QUARTER', simple.view_date, simple.order_date)",
-            "year": "DATE_DIFF('YEAR', simple.view_date, simple.order_date)",
-        }
-        order_by = ""
-        semi = ""
-    elif query_type == Definitions.druid:
-        result_lookup = {
-            "second": "TIMESTAMPDIFF(SECOND, simple.view_date, simple.order_date)",
-            "minute": "TIMESTAMPDIFF(MINUTE, simple.view_date, simple.order_date)",
-            "hour": "TIMESTAMPDIFF(HOUR, simple.view_date, simple.order_date)",
-            "day": "TIMESTAMPDIFF(DAY, simple.view_date, simple.order_date)",
-            "week": "TIMESTAMPDIFF(WEEK, simple.view_date, simple.order_date)",
-            "month": "TIMESTAMPDIFF(MONTH, simple.view_date, simple.order_date)",
-            "quarter": "TIMESTAMPDIFF(QUARTER, simple.view_date, simple.order_date)",
-            "year": "TIMESTAMPDIFF(YEAR, simple.view_date, simple.order_date)",
-        }
-        order_by = ""
-        semi = ""
-    elif query_type in {Definitions.sql_server, Definitions.azure_synapse, Definitions.databricks}:
-        result_lookup = {
-            "second": "DATEDIFF(SECOND, simple.view_date, simple.order_date)",
-            "minute": "DATEDIFF(MINUTE, simple.view_date, simple.order_date)",
-            "hour": "DATEDIFF(HOUR, simple.view_date, simple.order_date)",
-            "day": "DATEDIFF(DAY, simple.view_date, simple.order_date)",
-            "week": "DATEDIFF(WEEK, simple.view_date, simple.order_date)",
-            "month": "DATEDIFF(MONTH, simple.view_date, simple.order_date)",
-            "quarter": "DATEDIFF(QUARTER, simple.view_date, simple.order_date)",
-            "year": "DATEDIFF(YEAR, simple.view_date, simple.order_date)",
-        }
-        order_by = ""
-    elif query_type == Definitions.postgres:
-        result_lookup = {
-            "second": (  # noqa
-                "DATE_PART('DAY', AGE(simple.order_date, simple.view_date)) * 24 + DATE_PART('HOUR',"
-                " AGE(simple.order_date, simple.view_date)) * 60 + DATE_PART('MINUTE', AGE(simple.order_date,"
-                " simple.view_date)) * 60 + DATE_PART('SECOND', AGE(simple.order_date, simple.view_date))"
-            ),
-            "minute": (  # noqa
-                "DATE_PART('DAY', AGE(simple.order_date, simple.view_date)) * 24 + DATE_PART('HOUR',"
-                " AGE(simple.order_date, simple.view_date)) * 60 + DATE_PART('MINUTE', AGE(simple.order_date,"
-                " simple.view_date))"
-            ),
-            "hour": (  # noqa
-                "DATE_PART('DAY', AGE(simple.order_date, simple.view_date)) * 24 + DATE_PART('HOUR',"
-                " AGE(simple.order_date, simple.view_date))"
-            ),
-            "day": "DATE_PART('DAY', AGE(simple.order_date, simple.view_date))",
-            "week": "TRUNC(DATE_PART('DAY', AGE(simple.order_date, simple.view_date))/7)",
-            "month": (  # noqa
-                "DATE_PART('YEAR', AGE(simple.order_date, simple.view_date)) * 12 + (DATE_PART('month',"
-                " AGE(simple.order_date, simple.view_date)))"
-            ),
-            "quarter": (  # noqa
-                "DATE_PART('YEAR', AGE(simple.order_date, simple.view_date)) * 4 + TRUNC(DATE_PART('month',"
-                " AGE(simple.order_date, simple.view_date))/3)"
-            ),
-            "year": "DATE_PART('YEAR', AGE(simple.order_date, simple.view_date))",
-        }
-        order_by = ""
-    else:
-        result_lookup = {
-            "second": (  # noqa
-                "TIMESTAMP_DIFF(CAST(simple.order_date as TIMESTAMP), CAST(simple.view_date as TIMESTAMP),"
-                " SECOND)"
-            ),
-            "minute": (  # noqa
-                "TIMESTAMP_DIFF(CAST(simple.order_date as TIMESTAMP), CAST(simple.view_date as TIMESTAMP),"
-                " MINUTE)"
-            ),
-            "hour": (  # noqa
-                "TIMESTAMP_DIFF(CAST(simple.order_date as TIMESTAMP), CAST(simple.view_date as TIMESTAMP),"
-                " HOUR)"
-            ),
-            "day": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), DAY)",
-            "week": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), ISOWEEK)",
-            "month": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), MONTH)",
-            "quarter": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), QUARTER)",
-            "year": "DATE_DIFF(CAST(simple.order_date as DATE), CAST(simple.view_date as DATE), ISOYEAR)",
-        }
-        order_by = ""
-    if raises_error:
         assert exc_info.value
-    else:
-        interval_result = result_lookup[interval]
+        return
 
-        correct = (
-            f"SELECT {interval_result} as simple_{interval}s_waiting,"
-            "SUM(simple.revenue) as simple_total_revenue FROM "
-            f"analytics.orders simple GROUP BY {interval_result if query_type != Definitions.bigquery else f'simple_{interval}s_waiting'}"  # noqa
-            f"{order_by}{semi}"
-        )
-        assert query == correct
+    query = simple_conn.get_sql_query(
+        metrics=["total_revenue"],
+        dimensions=[f"{interval}s_waiting"],
+        query_type=query_type,
+    )
+    assert query == _EXPECTED_INTERVAL[(interval, query_type)]
 
-        correct_label = f"{interval.replace('_', ' ').title()}s Between view and order"
-        assert field.label == correct_label
+    field = simple_conn.project.get_field(f"{interval}s_waiting")
+    assert field.label == f"{interval.replace('_', ' ').title()}s Between view and order"
 
 
 @pytest.mark.query
-def test_simple_query_two_group_by(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["total_revenue"], dimensions=["channel", "new_vs_repeat"])
+def test_simple_query_two_group_by(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["total_revenue"], dimensions=["channel", "new_vs_repeat"])
 
     correct = (
         "SELECT simple.sales_channel as simple_channel,simple.new_vs_repeat as simple_new_vs_repeat,"
@@ -1370,10 +1379,8 @@ def test_simple_query_two_group_by(connections):
 
 
 @pytest.mark.query
-def test_simple_query_two_metric(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_two_metric(simple_conn):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue", "average_order_value"],
         dimensions=["channel", "new_vs_repeat"],
     )
@@ -1388,10 +1395,8 @@ def test_simple_query_two_metric(connections):
 
 
 @pytest.mark.query
-def test_simple_query_custom_dimension(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["total_revenue"], dimensions=["is_valid_order"])
+def test_simple_query_custom_dimension(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["total_revenue"], dimensions=["is_valid_order"])
 
     correct = (
         "SELECT (CASE WHEN simple.sales_channel != 'fraud' THEN TRUE ELSE FALSE END) as "
@@ -1403,10 +1408,8 @@ def test_simple_query_custom_dimension(connections):
 
 
 @pytest.mark.query
-def test_simple_query_custom_metric(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(metrics=["revenue_per_aov"], dimensions=["channel"])
+def test_simple_query_custom_metric(simple_conn):
+    query = simple_conn.get_sql_query(metrics=["revenue_per_aov"], dimensions=["channel"])
 
     correct = (
         "SELECT simple.sales_channel as simple_channel,CASE WHEN (AVG(simple.revenue)) = 0 THEN 0 ELSE"
@@ -1416,6 +1419,89 @@ def test_simple_query_custom_metric(connections):
     assert query == correct
 
 
+def _sunday_week_bounds(now):
+    # The model's weeks start on sunday. Compute last week directly instead of flipping
+    # pendulum's process-wide week_starts_at setting, which isn't safe with other tests running
+    days_since_sunday = now.isoweekday() % 7
+    start = now.subtract(days=7 + days_since_sunday).start_of("day")
+    return start, start.add(days=6).end_of("day")
+
+
+_WHERE_DIM_GROUP_FAMILY = {
+    Definitions.snowflake: "ansi",
+    Definitions.redshift: "ansi",
+    Definitions.druid: "ansi",
+    Definitions.duck_db: "ansi",
+    Definitions.databricks: "ansi",
+    Definitions.trino: "trino",
+    Definitions.sql_server: "sql_server",
+    Definitions.bigquery: "bigquery",
+}
+
+# (dialect family, value kind, field) -> expected condition. The templates are filled in with
+# the dialect's field_id, last_year, and the week_start and week_end of last week
+_WHERE_DIM_GROUP_CONDITIONS = {
+    ("ansi", "str", "order_date"): "DATE_TRUNC('DAY', {field_id})>'2021-08-04'",
+    ("trino", "str", "order_date"): "DATE_TRUNC('DAY', {field_id})>'2021-08-04'",
+    ("sql_server", "str", "order_date"): "CAST(CAST({field_id} AS DATE) AS DATETIME)>'2021-08-04'",
+    ("bigquery", "str", "order_date"): (
+        "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)>'2021-08-04'"
+    ),
+    ("ansi", "datetime", "order_date"): "DATE_TRUNC('DAY', {field_id})>'2021-08-04T00:00:00'",
+    ("ansi", "datetime", "previous_order_date"): "DATE_TRUNC('DAY', {field_id})>'2021-08-04T00:00:00'",
+    ("ansi", "datetime", "first_order_date"): "DATE_TRUNC('DAY', {field_id})>'2021-08-04T00:00:00'",
+    ("sql_server", "datetime", "order_date"): (
+        "CAST(CAST({field_id} AS DATE) AS DATETIME)>'2021-08-04T00:00:00'"
+    ),
+    ("sql_server", "datetime", "previous_order_date"): (
+        "CAST(CAST({field_id} AS DATE) AS DATETIME)>'2021-08-04T00:00:00'"
+    ),
+    ("sql_server", "datetime", "first_order_date"): (
+        "CAST(CAST({field_id} AS DATE) AS DATETIME)>'2021-08-04T00:00:00'"
+    ),
+    ("bigquery", "datetime", "order_date"): (
+        "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)"
+        ">CAST('2021-08-04 00:00:00' AS TIMESTAMP)"
+    ),
+    ("bigquery", "datetime", "previous_order_date"): (
+        "CAST(DATE_TRUNC(CAST(simple.previous_order_date AS DATE), DAY) AS DATETIME)"
+        ">CAST(CAST('2021-08-04 00:00:00' AS TIMESTAMP) AS DATETIME)"
+    ),
+    ("bigquery", "datetime", "first_order_date"): (
+        "CAST(DATE_TRUNC(CAST(simple.first_order_date AS DATE), DAY) AS DATE)"
+        ">CAST(CAST('2021-08-04 00:00:00' AS TIMESTAMP) AS DATE)"
+    ),
+    ("trino", "datetime", "order_date"): (
+        "DATE_TRUNC('DAY', CAST(simple.order_date AS TIMESTAMP))>CAST('2021-08-04 00:00:00' AS TIMESTAMP)"
+    ),
+    ("trino", "datetime", "first_order_date"): (
+        "DATE_TRUNC('DAY', CAST(simple.first_order_date AS TIMESTAMP))"
+        ">CAST(CAST('2021-08-04 00:00:00' AS TIMESTAMP) AS DATE)"
+    ),
+    ("ansi", "last year", "order_date"): (
+        "DATE_TRUNC('DAY', {field_id})>='{last_year}-01-01T00:00:00' AND "
+        "DATE_TRUNC('DAY', {field_id})<='{last_year}-12-31T23:59:59'"
+    ),
+    ("trino", "last year", "order_date"): (
+        "DATE_TRUNC('DAY', {field_id})>=CAST('{last_year}-01-01T00:00:00' AS TIMESTAMP) AND "
+        "DATE_TRUNC('DAY', {field_id})<=CAST('{last_year}-12-31T23:59:59' AS TIMESTAMP)"
+    ),
+    ("sql_server", "last year", "order_date"): (
+        "CAST(CAST({field_id} AS DATE) AS DATETIME)>='{last_year}-01-01T00:00:00' AND "
+        "CAST(CAST({field_id} AS DATE) AS DATETIME)<='{last_year}-12-31T23:59:59'"
+    ),
+    ("bigquery", "last year", "order_date"): (
+        "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)"
+        ">=CAST('{last_year}-01-01T00:00:00' AS TIMESTAMP) AND "
+        "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)"
+        "<=CAST('{last_year}-12-31T23:59:59' AS TIMESTAMP)"
+    ),
+    ("ansi", "last week", "order_date"): (
+        "DATE_TRUNC('DAY', {field_id})>='{week_start}' AND DATE_TRUNC('DAY', {field_id})<='{week_end}'"
+    ),
+}
+
+
 @pytest.mark.parametrize(
     "field,expression,value,query_type",
     [
@@ -1462,112 +1548,41 @@ def test_simple_query_custom_metric(connections):
     ],
 )
 @pytest.mark.query
-def test_simple_query_with_where_dim_group(connections, field, expression, value, query_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_with_where_dim_group(simple_conn, field, expression, value, query_type):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"],
         dimensions=["channel"],
         where=[{"field": field, "expression": expression, "value": value}],
         query_type=query_type,
     )
+    now = pendulum.now("UTC")
 
-    if query_type in {
-        Definitions.bigquery,
-        Definitions.databricks,
-        Definitions.druid,
-        Definitions.sql_server,
-        Definitions.trino,
-    }:
+    if query_type in _NO_DEFAULT_ORDER:
         order_by = ""
     else:
-        order_by = " ORDER BY simple_total_revenue DESC NULLS LAST"
+        order_by = _ORDER_DESC
 
     semi = ";"
-    if query_type in {Definitions.druid, Definitions.trino}:
+    if query_type in _NO_SEMICOLON:
         semi = ""
-    sf_or_rs = query_type in {
-        Definitions.snowflake,
-        Definitions.redshift,
-        Definitions.druid,
-        Definitions.duck_db,
-        Definitions.databricks,
-        Definitions.trino,
-    }
-    if query_type not in {Definitions.druid, Definitions.duck_db, Definitions.databricks, Definitions.trino}:
+    if query_type not in _CAST_TO_TIMESTAMP:
         field_id = f"simple.{field}"
     else:
         field_id = f"CAST(simple.{field} AS TIMESTAMP)"
-    if sf_or_rs and expression == "greater_than" and isinstance(value, str):
-        condition = f"DATE_TRUNC('DAY', {field_id})>'2021-08-04'"
-    elif query_type == Definitions.sql_server and isinstance(value, str) and expression == "greater_than":
-        condition = f"CAST(CAST({field_id} AS DATE) AS DATETIME)>'2021-08-04'"
-    elif (
-        query_type == Definitions.sql_server and isinstance(value, datetime) and expression == "greater_than"
-    ):
-        condition = f"CAST(CAST({field_id} AS DATE) AS DATETIME)>'2021-08-04T00:00:00'"
-    elif sf_or_rs and query_type != Definitions.trino and isinstance(value, datetime):
-        condition = f"DATE_TRUNC('DAY', {field_id})>'2021-08-04T00:00:00'"
-    elif (
-        query_type == Definitions.bigquery
-        and expression == "greater_than"
-        and isinstance(value, str)
-        and field == "order_date"
-    ):
-        condition = "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)>'2021-08-04'"
-    elif query_type == Definitions.bigquery and isinstance(value, datetime) and field == "order_date":
-        condition = "CAST(DATE_TRUNC(CAST(simple.order_date AS DATE), DAY) AS TIMESTAMP)>CAST('2021-08-04 00:00:00' AS TIMESTAMP)"  # noqa
-    elif query_type == Definitions.trino and isinstance(value, datetime) and field == "order_date":
-        condition = "DATE_TRUNC('DAY', CAST(simple.order_date AS TIMESTAMP))>CAST('2021-08-04 00:00:00' AS TIMESTAMP)"  # noqa
-    elif (
-        query_type == Definitions.bigquery and isinstance(value, datetime) and field == "previous_order_date"
-    ):
-        condition = "CAST(DATE_TRUNC(CAST(simple.previous_order_date AS DATE), DAY) AS DATETIME)>CAST(CAST('2021-08-04 00:00:00' AS TIMESTAMP) AS DATETIME)"  # noqa
-    elif query_type == Definitions.trino and isinstance(value, datetime) and field == "first_order_date":
-        condition = "DATE_TRUNC('DAY', CAST(simple.first_order_date AS TIMESTAMP))>CAST(CAST('2021-08-04 00:00:00' AS TIMESTAMP) AS DATE)"  # noqa
-    elif query_type == Definitions.bigquery and isinstance(value, datetime) and field == "first_order_date":
-        condition = "CAST(DATE_TRUNC(CAST(simple.first_order_date AS DATE), DAY) AS DATE)>CAST(CAST('2021-08-04 00:00:00' AS TIMESTAMP) AS DATE)"  # noqa
-    elif sf_or_rs and expression == "matches" and value == "last year":
-        last_year = pendulum.now("UTC").year - 1
-        if query_type == Definitions.trino:
-            start_of = f"CAST('{last_year}-01-01T00:00:00' AS TIMESTAMP)"
-            end_of = f"CAST('{last_year}-12-31T23:59:59' AS TIMESTAMP)"
-        else:
-            start_of = f"'{last_year}-01-01T00:00:00'"
-            end_of = f"'{last_year}-12-31T23:59:59'"
-        condition = f"DATE_TRUNC('DAY', {field_id})>={start_of} AND "
-        condition += f"DATE_TRUNC('DAY', {field_id})<={end_of}"
-    elif query_type == Definitions.sql_server and expression == "matches" and value == "last year":
-        last_year = pendulum.now("UTC").year - 1
-        condition = f"CAST(CAST({field_id} AS DATE) AS DATETIME)>='{last_year}-01-01T00:00:00' AND "
-        condition += f"CAST(CAST({field_id} AS DATE) AS DATETIME)<='{last_year}-12-31T23:59:59'"
-    elif sf_or_rs and expression == "matches" and value == "last week":
-        date_format = "%Y-%m-%dT%H:%M:%S"
-        pendulum.week_starts_at(pendulum.SUNDAY)
-        pendulum.week_ends_at(pendulum.SATURDAY)
-        start_of = pendulum.now("UTC").subtract(days=7).start_of("week").strftime(date_format)
-        end_of = pendulum.now("UTC").subtract(days=7).end_of("week").strftime(date_format)
-        if query_type == Definitions.trino:
-            start_of = f"CAST('{start_of}' AS TIMESTAMP)"
-            end_of = f"CAST('{end_of}' AS TIMESTAMP)"
-        else:
-            start_of = f"'{start_of}'"
-            end_of = f"'{end_of}'"
-        condition = f"DATE_TRUNC('DAY', {field_id})>={start_of} AND "
-        condition += f"DATE_TRUNC('DAY', {field_id})<={end_of}"
-        pendulum.week_starts_at(pendulum.MONDAY)
-        pendulum.week_ends_at(pendulum.SUNDAY)
-    elif query_type == Definitions.bigquery and expression == "matches":
-        last_year = pendulum.now("UTC").year - 1
-        condition = f"CAST(DATE_TRUNC(CAST(simple.{field} AS DATE), DAY) AS TIMESTAMP)>=CAST('{last_year}-01-01T00:00:00' AS TIMESTAMP) AND "  # noqa
-        condition += f"CAST(DATE_TRUNC(CAST(simple.{field} AS DATE), DAY) AS TIMESTAMP)<=CAST('{last_year}-12-31T23:59:59' AS TIMESTAMP)"  # noqa
 
-    correct = (
-        "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
-        f"analytics.orders simple WHERE {condition} "
-        f"GROUP BY {'simple.sales_channel' if query_type != Definitions.bigquery else 'simple_channel'}"
-        f"{order_by}{semi}"
+    # Relative filters are keyed by their value, absolute ones by the type of the value
+    kind = value if expression == "matches" else type(value).__name__
+    template = _WHERE_DIM_GROUP_CONDITIONS[(_WHERE_DIM_GROUP_FAMILY[query_type], kind, field)]
+    week_start, week_end = _sunday_week_bounds(now)
+    condition = template.format(
+        field_id=field_id,
+        last_year=now.year - 1,
+        week_start=week_start.strftime("%Y-%m-%dT%H:%M:%S"),
+        week_end=week_end.strftime("%Y-%m-%dT%H:%M:%S"),
     )
+
+    group_by = _GROUP_BY if query_type != Definitions.bigquery else "GROUP BY simple_channel"
+    correct = f"{_SELECT_PREFIX}WHERE {condition} {group_by}{order_by}{semi}"
     assert query == correct
 
 
@@ -1587,191 +1602,200 @@ def test_simple_query_convert_tz_alias_no(connections):
     assert query == correct
 
 
-# Druid does not support ilike
-@pytest.mark.parametrize(
-    "field_name,filter_type,value,query_type",
-    [
-        ("channel", "equal_to", "Email", Definitions.snowflake),
-        ("channel", "not_equal_to", "Email", Definitions.snowflake),
-        ("channel", "contains", "Email", Definitions.snowflake),
-        ("channel", "does_not_contain", "Email", Definitions.snowflake),
-        ("channel", "contains_case_insensitive", "Email", Definitions.snowflake),
-        ("channel", "contains_case_insensitive", "Email", Definitions.databricks),
-        ("channel", "contains_case_insensitive", "Email", Definitions.druid),
-        ("channel", "contains_case_insensitive", "Email", Definitions.sql_server),
-        ("channel", "contains_case_insensitive", "Email", Definitions.trino),
-        ("channel", "does_not_contain_case_insensitive", "Email", Definitions.snowflake),
-        ("channel", "does_not_contain_case_insensitive", "Email", Definitions.databricks),
-        ("channel", "does_not_contain_case_insensitive", "Email", Definitions.druid),
-        ("channel", "does_not_contain_case_insensitive", "Email", Definitions.sql_server),
-        ("channel", "does_not_contain_case_insensitive", "Email", Definitions.trino),
-        ("channel", "starts_with", "Email", Definitions.snowflake),
-        ("channel", "ends_with", "Email", Definitions.snowflake),
-        ("channel", "does_not_start_with", "Email", Definitions.snowflake),
-        ("channel", "does_not_end_with", "Email", Definitions.snowflake),
-        ("channel", "starts_with_case_insensitive", "Email", Definitions.snowflake),
-        ("channel", "ends_with_case_insensitive", "Email", Definitions.snowflake),
-        ("channel", "does_not_start_with_case_insensitive", "Email", Definitions.snowflake),
-        ("channel", "does_not_end_with_case_insensitive", "Email", Definitions.snowflake),
-        ("is_valid_order", "is_null", None, Definitions.snowflake),
-        ("is_valid_order", "is_not_null", None, Definitions.snowflake),
-        ("is_valid_order", "is_not_null", None, Definitions.databricks),
-        ("is_valid_order", "is_not_null", None, Definitions.druid),
-        ("is_valid_order", "is_not_null", None, Definitions.sql_server),
-        ("is_valid_order", "is_not_null", None, Definitions.trino),
-        ("is_valid_order", "boolean_true", None, Definitions.snowflake),
-        ("is_valid_order", "boolean_false", None, Definitions.snowflake),
-        ("is_valid_order", "boolean_true", None, Definitions.sql_server),
-        ("is_valid_order", "boolean_false", None, Definitions.sql_server),
-        ("is_valid_order", "boolean_true", None, Definitions.trino),
-        ("is_valid_order", "boolean_false", None, Definitions.trino),
-    ],
+# field, filter expression, value, expected where condition, and the dialects to check it on.
+# Druid does not support ilike, so it's covered by the case insensitive filters
+_SF_ONLY = (Definitions.snowflake,)
+_FILTER_DIALECTS = (
+    Definitions.snowflake,
+    Definitions.databricks,
+    Definitions.druid,
+    Definitions.sql_server,
+    Definitions.trino,
+)
+_WHERE_DICT_FILTERS = (
+    ("channel", "equal_to", "Email", "simple.sales_channel='Email'", _SF_ONLY),
+    ("channel", "not_equal_to", "Email", "simple.sales_channel<>'Email'", _SF_ONLY),
+    ("channel", "contains", "Email", "simple.sales_channel LIKE '%Email%'", _SF_ONLY),
+    ("channel", "does_not_contain", "Email", "simple.sales_channel NOT LIKE '%Email%'", _SF_ONLY),
+    (
+        "channel",
+        "contains_case_insensitive",
+        "Email",
+        "LOWER(simple.sales_channel) LIKE LOWER('%Email%')",
+        _FILTER_DIALECTS,
+    ),
+    (
+        "channel",
+        "does_not_contain_case_insensitive",
+        "Email",
+        "LOWER(simple.sales_channel) NOT LIKE LOWER('%Email%')",
+        _FILTER_DIALECTS,
+    ),
+    ("channel", "starts_with", "Email", "simple.sales_channel LIKE 'Email%'", _SF_ONLY),
+    ("channel", "ends_with", "Email", "simple.sales_channel LIKE '%Email'", _SF_ONLY),
+    ("channel", "does_not_start_with", "Email", "simple.sales_channel NOT LIKE 'Email%'", _SF_ONLY),
+    ("channel", "does_not_end_with", "Email", "simple.sales_channel NOT LIKE '%Email'", _SF_ONLY),
+    (
+        "channel",
+        "starts_with_case_insensitive",
+        "Email",
+        "LOWER(simple.sales_channel) LIKE LOWER('Email%')",
+        _SF_ONLY,
+    ),
+    (
+        "channel",
+        "ends_with_case_insensitive",
+        "Email",
+        "LOWER(simple.sales_channel) LIKE LOWER('%Email')",
+        _SF_ONLY,
+    ),
+    (
+        "channel",
+        "does_not_start_with_case_insensitive",
+        "Email",
+        "LOWER(simple.sales_channel) NOT LIKE LOWER('Email%')",
+        _SF_ONLY,
+    ),
+    (
+        "channel",
+        "does_not_end_with_case_insensitive",
+        "Email",
+        "LOWER(simple.sales_channel) NOT LIKE LOWER('%Email')",
+        _SF_ONLY,
+    ),
+    (
+        "is_valid_order",
+        "is_null",
+        None,
+        "(CASE WHEN simple.sales_channel != 'fraud' THEN TRUE ELSE FALSE END) IS NULL",
+        _SF_ONLY,
+    ),
+    (
+        "is_valid_order",
+        "is_not_null",
+        None,
+        "NOT (CASE WHEN simple.sales_channel != 'fraud' THEN TRUE ELSE FALSE END) IS NULL",
+        _FILTER_DIALECTS,
+    ),
+    (
+        "is_valid_order",
+        "boolean_true",
+        None,
+        "(CASE WHEN simple.sales_channel != 'fraud' THEN TRUE ELSE FALSE END)",
+        (Definitions.snowflake, Definitions.sql_server, Definitions.trino),
+    ),
+    (
+        "is_valid_order",
+        "boolean_false",
+        None,
+        "NOT (CASE WHEN simple.sales_channel != 'fraud' THEN TRUE ELSE FALSE END)",
+        (Definitions.snowflake, Definitions.sql_server, Definitions.trino),
+    ),
 )
-@pytest.mark.query
-def test_simple_query_with_where_dict(connections, field_name, filter_type, value, query_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
 
-    query = conn.get_sql_query(
-        metrics=["total_revenue"],
-        dimensions=[f"simple.channel"],
-        where=[{"field": field_name, "expression": filter_type, "value": value}],
-        query_type=query_type,
-    )
 
+def _expected_where_dict(condition: str, query_type: str):
     if query_type == Definitions.snowflake:
-        order_by = " ORDER BY simple_total_revenue DESC NULLS LAST"
+        order_by = _ORDER_DESC
         semi = ";"
-    elif query_type in {Definitions.druid, Definitions.trino}:
+    elif query_type in _NO_SEMICOLON:
         order_by = ""
         semi = ""
     else:
         order_by = ""
         semi = ";"
-    result_lookup = {
-        "equal_to": f"='{value}'",
-        "not_equal_to": f"<>'{value}'",
-        "contains": f" LIKE '%{value}%'",
-        "does_not_contain": f" NOT LIKE '%{value}%'",
-        "contains_case_insensitive": f" LIKE LOWER('%{value}%')",
-        "does_not_contain_case_insensitive": f" NOT LIKE LOWER('%{value}%')",
-        "starts_with": f" LIKE '{value}%'",
-        "ends_with": f" LIKE '%{value}'",
-        "does_not_start_with": f" NOT LIKE '{value}%'",
-        "does_not_end_with": f" NOT LIKE '%{value}'",
-        "starts_with_case_insensitive": f" LIKE LOWER('{value}%')",
-        "ends_with_case_insensitive": f" LIKE LOWER('%{value}')",
-        "does_not_start_with_case_insensitive": f" NOT LIKE LOWER('{value}%')",
-        "does_not_end_with_case_insensitive": f" NOT LIKE LOWER('%{value}')",
-        "is_null": " IS NULL",
-        "is_not_null": " IS NULL",
-        "boolean_true": "",
-        "boolean_false": "",
-    }
-    prefix_filter = {
-        "is_not_null": "NOT ",
-        "boolean_false": "NOT ",
-    }
-    dim_lookup = {
-        "channel": "simple.sales_channel",
-        "is_valid_order": "(CASE WHEN simple.sales_channel != 'fraud' THEN TRUE ELSE FALSE END)",
-    }
-    dim_func = {
-        "contains_case_insensitive": lambda d: f"LOWER({d})",
-        "does_not_contain_case_insensitive": lambda d: f"LOWER({d})",
-        "starts_with_case_insensitive": lambda d: f"LOWER({d})",
-        "ends_with_case_insensitive": lambda d: f"LOWER({d})",
-        "does_not_start_with_case_insensitive": lambda d: f"LOWER({d})",
-        "does_not_end_with_case_insensitive": lambda d: f"LOWER({d})",
-    }
+    where = f"WHERE {condition} "
+    return _CHANNEL_TEMPLATE.substitute(where=where, having="", order_by=order_by, semi=semi)
 
-    filter_expr = result_lookup[filter_type]
-    prefix_expr = prefix_filter.get(filter_type, "")
-    dim_expr = dim_lookup[field_name]
-    dim_func = dim_func.get(filter_type, lambda d: d)
-    correct = (
-        "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
-        f"analytics.orders simple WHERE {prefix_expr}{dim_func(dim_expr)}{filter_expr} "
-        f"GROUP BY simple.sales_channel{order_by}{semi}"
-    )
-    assert query == correct
 
+# The expected SQL is formatted once at import so each case only runs the query
+_WHERE_DICT_CASES = [
+    (field_name, filter_type, value, query_type, _expected_where_dict(condition, query_type))
+    for field_name, filter_type, value, condition, query_types in _WHERE_DICT_FILTERS
+    for query_type in query_types
+]
 
-@pytest.mark.query
-def test_simple_query_with_where_literal(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
-        metrics=["total_revenue"], dimensions=["simple.channel"], where="${simple.channel} != 'Email'"
-    )
 
-    correct = (
-        "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
-        "analytics.orders simple WHERE simple.sales_channel != 'Email' GROUP BY simple.sales_channel "
-        "ORDER BY simple_total_revenue DESC NULLS LAST;"
+@pytest.mark.parametrize(
+    "field_name,filter_type,value,query_type,expected",
+    _WHERE_DICT_CASES,
+    ids=[f"{field}-{ft}-{qt}" for field, ft, _, qt, _ in _WHERE_DICT_CASES],
+)
+@pytest.mark.query
+def test_simple_query_with_where_dict(simple_conn, field_name, filter_type, value, query_type, expected):
+    query = simple_conn.get_sql_query(
+        metrics=["total_revenue"],
+        dimensions=["simple.channel"],
+        where=[{"field": field_name, "expression": filter_type, "value": value}],
+        query_type=query_type,
     )
-    assert query == correct
+    assert query == expected
 
 
 @pytest.mark.parametrize(
-    "filter_type",
+    "kwarg,literal,dimensions,clauses",
     [
-        "equal_to",
-        "not_equal_to",
-        "less_than",
-        "less_or_equal_than",
-        "greater_or_equal_than",
-        "greater_than",
-        "is_null",
-        "is_not_null",
+        pytest.param(
+            "where",
+            "${simple.channel} != 'Email'",
+            ["simple.channel"],
+            {"where": "WHERE simple.sales_channel != 'Email' ", "order_by": _ORDER_DESC},
+            id="where",
+        ),
+        pytest.param(
+            "having",
+            "${total_revenue} > 12",
+            ["channel"],
+            {"having": " HAVING (SUM(simple.revenue)) > 12", "order_by": _ORDER_DESC},
+            id="having",
+        ),
+        pytest.param(
+            "order_by",
+            "total_revenue asc",
+            ["channel"],
+            {"order_by": " ORDER BY simple_total_revenue ASC NULLS LAST"},
+            id="order_by",
+        ),
     ],
 )
 @pytest.mark.query
-def test_simple_query_with_having_dict(connections, filter_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
-        metrics=["total_revenue"],
-        dimensions=["channel"],
-        having=[{"field": "total_revenue", "expression": filter_type, "value": 12}],
-    )
+def test_simple_query_with_literal(simple_conn, kwarg, literal, dimensions, clauses):
+    query = simple_conn.get_sql_query(metrics=["total_revenue"], dimensions=dimensions, **{kwarg: literal})
 
-    result_lookup = {
-        "equal_to": "=12",
-        "not_equal_to": "<>12",
-        "less_than": "<12",
-        "less_or_equal_than": "<=12",
-        "greater_or_equal_than": ">=12",
-        "greater_than": ">12",
-        "is_null": " IS NULL",
-        "is_not_null": " IS NULL",
-    }
-    filter_expr = result_lookup[filter_type]
-    full_expr = f"SUM(simple.revenue){filter_expr}"
-    if filter_type == "is_not_null":
-        full_expr = "NOT " + full_expr
-    correct = (
-        "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
-        f"analytics.orders simple GROUP BY simple.sales_channel HAVING {full_expr} "
-        "ORDER BY simple_total_revenue DESC NULLS LAST;"
-    )
+    correct = _CHANNEL_TEMPLATE.substitute({"where": "", "having": "", "semi": ";", **clauses})
     assert query == correct
 
 
-@pytest.mark.query
-def test_simple_query_with_having_literal(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
-        metrics=["total_revenue"], dimensions=["channel"], having="${total_revenue} > 12"
-    )
+_HAVING_CONDITIONS = {
+    "equal_to": "SUM(simple.revenue)=12",
+    "not_equal_to": "SUM(simple.revenue)<>12",
+    "less_than": "SUM(simple.revenue)<12",
+    "less_or_equal_than": "SUM(simple.revenue)<=12",
+    "greater_or_equal_than": "SUM(simple.revenue)>=12",
+    "greater_than": "SUM(simple.revenue)>12",
+    "is_null": "SUM(simple.revenue) IS NULL",
+    "is_not_null": "NOT SUM(simple.revenue) IS NULL",
+}
 
-    correct = (
-        "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
-        "analytics.orders simple GROUP BY simple.sales_channel HAVING (SUM(simple.revenue)) > 12 "
-        "ORDER BY simple_total_revenue DESC NULLS LAST;"
+
+def _expected_having(condition: str):
+    having = f" HAVING {condition}"
+    return _CHANNEL_TEMPLATE.substitute(where="", having=having, order_by=_ORDER_DESC, semi=";")
+
+
+@pytest.mark.parametrize(
+    "filter_type,having_expected",
+    [(ft, _expected_having(condition)) for ft, condition in _HAVING_CONDITIONS.items()],
+    ids=list(_HAVING_CONDITIONS),
+)
+@pytest.mark.query
+def test_simple_query_with_having_dict(simple_conn, filter_type, having_expected):
+    query = simple_conn.get_sql_query(
+        metrics=["total_revenue"],
+        dimensions=["channel"],
+        having=[{"field": "total_revenue", "expression": filter_type, "value": 12}],
     )
-    assert query == correct
+    assert query == having_expected
 
 
 @pytest.mark.query
@@ -1790,10 +1814,8 @@ def test_simple_query_with_having_literal(connections):
         Definitions.azure_synapse,
     ],
 )
-def test_simple_query_with_order_by_dict(connections, query_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_with_order_by_dict(simple_conn, query_type):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue", "average_order_value", "max_revenue"],
         dimensions=["channel"],
         order_by=[
@@ -1809,16 +1831,8 @@ def test_simple_query_with_order_by_dict(connections, query_type):
     else:
         group_by = "simple.sales_channel"
 
-    semi = ";" if query_type not in {Definitions.druid, Definitions.trino} else ""
-    if query_type in {
-        Definitions.snowflake,
-        Definitions.redshift,
-        Definitions.duck_db,
-        Definitions.postgres,
-        Definitions.trino,
-        Definitions.databricks,
-        Definitions.bigquery,
-    }:
+    semi = ";" if query_type not in _NO_SEMICOLON else ""
+    if query_type in _ORDER_BY_NULLS_LAST:
         nulls_last = " NULLS LAST"
     else:
         nulls_last = ""
@@ -1833,25 +1847,8 @@ def test_simple_query_with_order_by_dict(connections, query_type):
 
 
 @pytest.mark.query
-def test_simple_query_with_order_by_literal(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
-        metrics=["total_revenue"], dimensions=["channel"], order_by="total_revenue asc"
-    )
-
-    correct = (
-        "SELECT simple.sales_channel as simple_channel,SUM(simple.revenue) as simple_total_revenue FROM "
-        "analytics.orders simple GROUP BY simple.sales_channel ORDER BY simple_total_revenue ASC NULLS LAST;"
-    )
-    assert query == correct
-
-
-@pytest.mark.query
-def test_simple_query_with_all(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_with_all(simple_conn):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"],
         dimensions=["channel"],
         where=[{"field": "channel", "expression": "not_equal_to", "value": "Email"}],
@@ -1868,10 +1865,8 @@ def test_simple_query_with_all(connections):
 
 
 @pytest.mark.query
-def test_simple_query_with_or_filters_no_nesting(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_with_or_filters_no_nesting(simple_conn):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"],
         dimensions=["channel"],
         where=[
@@ -1896,10 +1891,8 @@ def test_simple_query_with_or_filters_no_nesting(connections):
 
 
 @pytest.mark.query
-def test_simple_query_with_or_filters_single_nesting(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_with_or_filters_single_nesting(simple_conn):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"],
         dimensions=["channel"],
         where=[
@@ -1930,10 +1923,8 @@ def test_simple_query_with_or_filters_single_nesting(connections):
 
 
 @pytest.mark.query
-def test_simple_query_with_or_filters_triple_nesting(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_with_or_filters_triple_nesting(simple_conn):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"],
         dimensions=["channel"],
         where=[
@@ -1996,10 +1987,8 @@ def test_simple_query_with_or_filters_triple_nesting(connections):
 
 
 @pytest.mark.query
-def test_simple_query_with_or_filters_having(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
-    query = conn.get_sql_query(
+def test_simple_query_with_or_filters_having(simple_conn):
+    query = simple_conn.get_sql_query(
         metrics=["total_revenue"],
         dimensions=["channel"],
         having=[
@@ -2024,11 +2013,9 @@ def test_simple_query_with_or_filters_having(connections):
 
 
 @pytest.mark.query
-def test_simple_query_with_or_filters_errors(connections):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
+def test_simple_query_with_or_filters_errors(simple_conn):
     with pytest.raises(ParseError) as exc_info:
-        conn.get_sql_query(
+        simple_conn.get_sql_query(
             metrics=["total_revenue"],
             dimensions=["channel"],
             where=[
@@ -2048,9 +2035,7 @@ def test_simple_query_with_or_filters_errors(connections):
 
 @pytest.mark.query
 @pytest.mark.parametrize("filter_type", ["where", "having"])
-def test_simple_query_with_or_filters_invalid_field_types(connections, filter_type):
-    project = Project(models=[simple_model], views=[simple_view])
-    conn = MetricsLayerConnection(project=project, connections=connections)
+def test_simple_query_with_or_filters_invalid_field_types(simple_conn, filter_type):
     logical_filter = [
         {
             "logical_operator": "OR",
@@ -2066,7 +2051,7 @@ def test_simple_query_with_or_filters_invalid_field_types(connections, filter_ty
     else:
         filter_dict = {"having": logical_filter}
     with pytest.raises(QueryError) as exc_info:
-        conn.get_sql_query(metrics=["total_revenue"], dimensions=["channel"], **filter_dict)
+        simple_conn.get_sql_query(metrics=["total_revenue"], dimensions=["channel"], **filter_dict)
 
     assert exc_info.value
     assert "Cannot mix dimensions and measures in a compound filter with a logical_operator" in str(
@@ -113,8 +113,8 @@ def test_simple_query(connections, test_models_and_views):
 
     correct = (
         "SELECT simple.order_id as simple_order_id,simple.sales_channel as simple_channel,simple.revenue "
+        "as simple_total_revenue FROM analytics.orders simple;"
     )
-    correct += "as simple_total_revenue FROM analytics.orders simple;"
     assert query == correct
 
 
@@ -127,8 +127,6 @@ def test_query_complex_metric(connections, test_models_and_views):
 
     correct = (
         "SELECT simple.order_id as simple_order_id,simple.sales_channel as simple_channel,simple.revenue as "
-    )
-    correct += (
         "simple_average_order_value,simple.revenue as simple_total_revenue FROM analytics.orders simple;"
     )
     assert query == correct
@@ -199,9 +197,7 @@ def test_query_complex_metric_all(connections, test_models_and_views):
 
     correct = (
         "SELECT simple.order_id as simple_order_id,simple.sales_channel as simple_channel,simple.revenue as "
-    )
-    correct += (
         "simple_average_order_value,simple.revenue as simple_total_revenue FROM analytics.orders simple"
+        " WHERE simple.sales_channel<>'Email';"
     )
-    correct += " WHERE simple.sales_channel<>'Email';"
     assert query == correct